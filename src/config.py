@@ -1,5 +1,6 @@
 """Configuration module for the banking service."""
 
+from functools import lru_cache
 from typing import Optional
 
 from pydantic_settings import BaseSettings
@@ -23,12 +24,18 @@ class Settings(BaseSettings):
     database_echo: bool = False
     database_pool_size: int = 20
     database_max_overflow: int = 10
+    database_pool_recycle: int = 3600
+    database_pool_timeout: int = 30
 
     # JWT
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
 
+    # Password hashing; None keeps passlib's default cost. Dev/test envs can
+    # lower this (e.g. to 1000) for much faster signup/login paths.
+    password_hash_rounds: Optional[int] = None
+
     class Config:
         """Pydantic configuration."""
 
@@ -42,6 +49,7 @@ class Settings(BaseSettings):
         return self.app_env.lower() == "production"
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings (cached so the env file is parsed once)."""
     return Settings()  # type: ignore
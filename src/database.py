@@ -2,55 +2,138 @@
 
 from datetime import datetime, timezone
 from decimal import Decimal
+from enum import Enum
 from uuid import uuid4
 
 from sqlalchemy import (
+    BigInteger,
+    func,
     Column,
-    Numeric,
+    Integer,
     String,
     Boolean,
     DateTime,
-    Enum,
     ForeignKey,
     Index,
     Text,
+    TypeDecorator,
     UniqueConstraint,
+    Uuid,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base, relationship
 
+from src.config import get_settings
 from src.models import (
     TransactionType,
+    TransactionDirection,
     TransactionStatus,
     CardType,
     CardStatus,
 )
 
+_CENT = Decimal("0.01")
+
+
+def _utcnow() -> datetime:
+    """Return the current UTC time for client-side timestamp defaults.
+
+    Kept client-side (microsecond precision, one clock per process) so rows
+    created in the same second still order deterministically; the DDL-level
+    server_default=func.now() covers inserts that bypass the ORM.
+    """
+    return datetime.now(timezone.utc)
+
 Base = declarative_base()
 
+# In debug/dev builds an un-eager-loaded relationship access raises
+# InvalidRequestError instead of silently emitting a per-row SELECT, so N+1
+# regressions fail loudly; production keeps the default lazy="select".
+_lazy = "raise" if get_settings().debug else "select"
+
+
+class EnumAsString(TypeDecorator):
+    """Store a str-valued enum as plain VARCHAR.
+
+    Avoids native database ENUM types (catalog lookups on cold connections,
+    ALTER TYPE migrations on every new member) while keeping enum instances
+    on the Python side.
+    """
+
+    impl = String(20)
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum]) -> None:
+        """Initialize with the enum class used for round-tripping."""
+        super().__init__()
+        self.enum_class = enum_class
+        # Enum.__call__ walks descriptor machinery on every row; a plain dict
+        # keyed by value makes the per-row load a single O(1) lookup.
+        self._members = {member.value: member for member in enum_class}
+
+    def process_bind_param(self, value: "Enum | str | None", dialect: object) -> "str | None":
+        """Bind the raw string value instead of the enum instance."""
+        if value is None:
+            return None
+        return value.value if isinstance(value, Enum) else value
+
+    def process_result_value(self, value: "str | None", dialect: object) -> "Enum | None":
+        """Coerce stored strings back to enum instances via the value map."""
+        if value is None:
+            return None
+        return self._members[value]
+
+
+class Money(TypeDecorator):
+    """Store a monetary amount as int64 cents.
+
+    BigInteger is fixed 8 bytes with hardware arithmetic, versus NUMERIC's
+    variable-length representation and software decimal routines. Python code
+    and the API keep working in two-decimal-place Decimal; the conversion
+    happens at the bind/result boundary.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: "Decimal | int | None", dialect: object) -> "int | None":
+        """Convert a Decimal amount to whole cents."""
+        if value is None:
+            return None
+        return int(Decimal(value).quantize(_CENT) * 100)
+
+    def process_result_value(self, value: "int | None", dialect: object) -> "Decimal | None":
+        """Convert stored cents back to a two-decimal-place Decimal."""
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-2)
+
 
 class User(Base):
     """User database model."""
 
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(Uuid, primary_key=True, default=uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
     is_active = Column(Boolean, default=True, index=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        DateTime(timezone=True),
+        default=_utcnow,
+        onupdate=_utcnow,
+        server_default=func.now(),
         nullable=False,
     )
 
     # Relationships
-    accounts = relationship("Account", back_populates="holder")
-    cards = relationship("Card", back_populates="holder")
+    accounts = relationship("Account", back_populates="holder", lazy=_lazy)
+    cards = relationship("Card", back_populates="holder", lazy=_lazy)
 
     __table_args__ = (
         Index("idx_users_email", "email"),
@@ -63,28 +146,38 @@ class Account(Base):
 
     __tablename__ = "accounts"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(Uuid, primary_key=True, default=uuid4)
     account_number = Column(String(20), unique=True, nullable=False, index=True)
-    holder_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    holder_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
     account_type = Column(String(50), nullable=False)
-    balance = Column(Numeric(15, 2), default=Decimal("0.00"), nullable=False)
+    balance = Column(Money, default=Decimal("0.00"), nullable=False)
     is_active = Column(Boolean, default=True, index=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        DateTime(timezone=True),
+        default=_utcnow,
+        onupdate=_utcnow,
+        server_default=func.now(),
         nullable=False,
     )
 
     # Relationships
-    holder = relationship("User", back_populates="accounts")
-    transactions = relationship("Transaction", back_populates="account")
-    cards = relationship("Card", back_populates="account")
+    holder = relationship("User", back_populates="accounts", lazy=_lazy)
+    transactions = relationship("Transaction", back_populates="account", lazy=_lazy)
+    cards = relationship("Card", back_populates="account", lazy=_lazy)
 
     __table_args__ = (
         Index("idx_accounts_holder_id", "holder_id"),
-        Index("idx_accounts_is_active", "is_active"),
+        # Partial index for the hot "active accounts of a holder" listing;
+        # closed accounts accumulate forever but never match it.
+        Index(
+            "idx_accounts_active_holder",
+            "holder_id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
         UniqueConstraint("account_number", name="uq_accounts_account_number"),
     )
 
@@ -94,26 +187,34 @@ class Transaction(Base):
 
     __tablename__ = "transactions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
-    account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
-    transaction_type = Column(Enum(TransactionType), nullable=False)
-    amount = Column(Numeric(15, 2), nullable=False)
-    status = Column(Enum(TransactionStatus), default=TransactionStatus.PENDING, nullable=False)
-    balance_after = Column(Numeric(15, 2), nullable=False)
+    id = Column(Uuid, primary_key=True, default=uuid4)
+    account_id = Column(Uuid, ForeignKey("accounts.id"), nullable=False)
+    transaction_type = Column(EnumAsString(TransactionType), nullable=False)
+    # Resolved at insert time so statement aggregation never has to infer
+    # which side of a transfer a row sits on.
+    direction = Column(EnumAsString(TransactionDirection), nullable=False)
+    amount = Column(Money, nullable=False)
+    status = Column(EnumAsString(TransactionStatus), default=TransactionStatus.PENDING, nullable=False)
+    balance_after = Column(Money, nullable=False)
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        DateTime(timezone=True),
+        default=_utcnow,
+        onupdate=_utcnow,
+        server_default=func.now(),
         nullable=False,
     )
 
     # Relationships
-    account = relationship("Account", back_populates="transactions")
+    account = relationship("Account", back_populates="transactions", lazy=_lazy)
 
     __table_args__ = (
-        Index("idx_transactions_account_id", "account_id"),
+        # Composite index serves the account+date-range scans pre-sorted; it
+        # also covers lookups on account_id alone, so no single-column index.
+        Index("idx_transactions_account_created_at", account_id, created_at.desc(), id.desc()),
         Index("idx_transactions_status", "status"),
         Index("idx_transactions_created_at", "created_at"),
         Index("idx_transactions_type", "transaction_type"),
@@ -125,25 +226,28 @@ class Transfer(Base):
 
     __tablename__ = "transfers"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
-    from_account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
-    to_account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
-    amount = Column(Numeric(15, 2), nullable=False)
-    status = Column(Enum(TransactionStatus), default=TransactionStatus.PENDING, nullable=False)
+    id = Column(Uuid, primary_key=True, default=uuid4)
+    from_account_id = Column(Uuid, ForeignKey("accounts.id"), nullable=False)
+    to_account_id = Column(Uuid, ForeignKey("accounts.id"), nullable=False)
+    amount = Column(Money, nullable=False)
+    status = Column(EnumAsString(TransactionStatus), default=TransactionStatus.PENDING, nullable=False)
     description = Column(Text, nullable=True)
-    from_transaction_id = Column(UUID(as_uuid=True), nullable=True)
-    to_transaction_id = Column(UUID(as_uuid=True), nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    from_transaction_id = Column(Uuid, nullable=True)
+    to_transaction_id = Column(Uuid, nullable=True)
+    created_at = Column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        DateTime(timezone=True),
+        default=_utcnow,
+        onupdate=_utcnow,
+        server_default=func.now(),
         nullable=False,
     )
 
     __table_args__ = (
-        Index("idx_transfers_from_account_id", "from_account_id"),
-        Index("idx_transfers_to_account_id", "to_account_id"),
+        Index("idx_transfers_from_account_created_at", from_account_id, created_at.desc(), id.desc()),
+        Index("idx_transfers_to_account_created_at", to_account_id, created_at.desc(), id.desc()),
         Index("idx_transfers_status", "status"),
     )
 
@@ -153,26 +257,29 @@ class Card(Base):
 
     __tablename__ = "cards"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(Uuid, primary_key=True, default=uuid4)
     card_number = Column(String(19), unique=True, nullable=False, index=True)
     last_four = Column(String(4), nullable=False)
-    card_type = Column(Enum(CardType), nullable=False)
-    status = Column(Enum(CardStatus), default=CardStatus.ACTIVE, nullable=False)
-    holder_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
+    card_type = Column(EnumAsString(CardType), nullable=False)
+    status = Column(EnumAsString(CardStatus), default=CardStatus.ACTIVE, nullable=False)
+    holder_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
+    account_id = Column(Uuid, ForeignKey("accounts.id"), nullable=False)
     expiry_date = Column(String(7), nullable=False)  # MM/YYYY format
     cvv = Column(String(255), nullable=False)  # Encrypted
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        DateTime(timezone=True),
+        default=_utcnow,
+        onupdate=_utcnow,
+        server_default=func.now(),
         nullable=False,
     )
 
     # Relationships
-    holder = relationship("User", back_populates="cards")
-    account = relationship("Account", back_populates="cards")
+    holder = relationship("User", back_populates="cards", lazy=_lazy)
+    account = relationship("Account", back_populates="cards", lazy=_lazy)
 
     __table_args__ = (
         Index("idx_cards_holder_id", "holder_id"),
@@ -187,24 +294,27 @@ class Statement(Base):
 
     __tablename__ = "statements"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
-    account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
+    id = Column(Uuid, primary_key=True, default=uuid4)
+    account_id = Column(Uuid, ForeignKey("accounts.id"), nullable=False)
     start_date = Column(DateTime, nullable=False)
     end_date = Column(DateTime, nullable=False)
-    opening_balance = Column(Numeric(15, 2), nullable=False)
-    closing_balance = Column(Numeric(15, 2), nullable=False)
-    total_credits = Column(Numeric(15, 2), default=Decimal("0.00"), nullable=False)
-    total_debits = Column(Numeric(15, 2), default=Decimal("0.00"), nullable=False)
-    transaction_count = Column(String(10), default="0", nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    opening_balance = Column(Money, nullable=False)
+    closing_balance = Column(Money, nullable=False)
+    total_credits = Column(Money, default=Decimal("0.00"), nullable=False)
+    total_debits = Column(Money, default=Decimal("0.00"), nullable=False)
+    transaction_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        DateTime(timezone=True),
+        default=_utcnow,
+        onupdate=_utcnow,
+        server_default=func.now(),
         nullable=False,
     )
 
     __table_args__ = (
-        Index("idx_statements_account_id", "account_id"),
+        Index("idx_statements_account_start_date", account_id, start_date.desc(), id.desc()),
         Index("idx_statements_period", "start_date", "end_date"),
     )
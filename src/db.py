@@ -1,30 +1,100 @@
 """Database connection and session management."""
 
-from typing import Generator
+from typing import Generator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 
 from src.config import get_settings
 
-settings = get_settings()
+_engine: Optional[Engine] = None
 
-# Create database engine
-engine = create_engine(
-    settings.database_url,
-    echo=settings.database_echo,
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
-    pool_pre_ping=True,  # Verify connections before using them
+# Applied to every SQLite connection: WAL lets readers proceed during writes
+# instead of serializing behind them, NORMAL sync is safe under WAL, and the
+# 64 MB page cache plus mmap keep hot rows in memory.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
 )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _create_sqlite_engine(database_url: str, echo: bool) -> Engine:
+    """Create a SQLite engine tuned for the dev/test workload.
+
+    A single shared connection (StaticPool) avoids per-request open/close,
+    and the pragmas are re-applied on connect since they are per-connection
+    state.
+    """
+    engine = create_engine(
+        database_url,
+        echo=echo,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return engine
+
+# Session factory; sessions are bound to the lazily created engine in get_db
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+def get_engine() -> Engine:
+    """Get the process-wide engine, creating it on first use.
+
+    Deferring creation keeps module import free of side effects: the app can
+    warm the pool from its startup hook instead of paying for it before the
+    server even binds its port.
+
+    Size the pool so that workers * (pool_size + max_overflow) stays below the
+    server's max_connections (minus a reserve for admin sessions) — every
+    Uvicorn worker gets its own pool.
+    """
+    global _engine
+    if _engine is None:
+        settings = get_settings()
+        if settings.database_url.startswith("sqlite"):
+            _engine = _create_sqlite_engine(settings.database_url, settings.database_echo)
+            return _engine
+        _engine = create_engine(
+            settings.database_url,
+            echo=settings.database_echo,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_recycle=settings.database_pool_recycle,  # Refresh long-idle connections
+            pool_timeout=settings.database_pool_timeout,  # Fail fast instead of queueing forever
+            pool_pre_ping=True,  # Verify connections before using them
+            # The hot routes re-issue the same handful of parameterized
+            # statements; a larger cache keeps all of them compiled. psycopg3
+            # additionally promotes repeated statements to server-side
+            # prepared plans on its own default threshold.
+            query_cache_size=1200,
+        )
+    return _engine
+
+
+def dispose_engine() -> None:
+    """Dispose of the engine's connection pool."""
+    global _engine
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
 
 
 def get_db() -> Generator[Session, None, None]:
     """Get database session dependency."""
-    db = SessionLocal()
+    db = SessionLocal(bind=get_engine())
     try:
         yield db
     finally:
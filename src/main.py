@@ -1,18 +1,15 @@
 """Main FastAPI application."""
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
 
-from src.config import get_settings
+from src.config import Settings, get_settings
+from src.db import dispose_engine, get_engine
 from src.routes import router
 
-settings = get_settings()
-
-# Create FastAPI application with enhanced documentation
-app = FastAPI(
-    title="Banking Service API",
-    description="""
+_DESCRIPTION = """
 # Banking REST Service
 
 A comprehensive banking service with the following capabilities:
@@ -42,59 +39,107 @@ A comprehensive banking service with the following capabilities:
 - Comprehensive error handling with HTTP status codes
 - Request/response validation with Pydantic
 - OpenAPI 3.0.0 specification with Swagger UI and ReDoc documentation
-""",
-    version="0.1.0",
-    contact={
-        "name": "Banking Service Support",
-        "email": "support@bankingservice.com",
-    },
-    license_info={
-        "name": "MIT",
-        "url": "https://opensource.org/licenses/MIT",
-    },
-    docs_url="/api/docs",
-    redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json",
-)
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"] if settings.debug else ["localhost", "127.0.0.1"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routes
-app.include_router(router, prefix="/api/v1", tags=["banking"])
-
-
-@app.get("/")
-def root() -> dict:
-    """Root endpoint with service information."""
-    return {
-        "name": settings.app_name,
-        "version": "0.1.0",
-        "environment": settings.app_env,
-        "documentation": {
-            "swagger_ui": "/api/docs",
-            "redoc": "/api/redoc",
-            "openapi_json": "/api/openapi.json",
-        },
-        "status": "running",
-    }
+"""
 
 
-@app.get("/health", tags=["health"])
-def health_check() -> dict:
-    """
-    Health check endpoint.
-    
-    Returns the current status of the service.
+def create_app(settings: Settings, testing: bool = False) -> FastAPI:
+    """Build the FastAPI application for the given settings.
+
+    A single factory keeps middleware registration and router inclusion in
+    one place — the app (and its OpenAPI schema) is constructed exactly once
+    per process, however many entry points import it. With ``testing=True``
+    the browser-facing middleware is skipped so in-process test requests
+    don't pay for it.
     """
-    return {
-        "status": "healthy",
-        "service": settings.app_name,
-        "version": "0.1.0",
-    }
+    application = FastAPI(
+        title="Banking Service API",
+        description=_DESCRIPTION,
+        version="0.1.0",
+        contact={
+            "name": "Banking Service Support",
+            "email": "support@bankingservice.com",
+        },
+        license_info={
+            "name": "MIT",
+            "url": "https://opensource.org/licenses/MIT",
+        },
+        docs_url="/api/docs",
+        redoc_url="/api/redoc",
+        openapi_url="/api/openapi.json",
+        default_response_class=ORJSONResponse,
+    )
+
+    # Add CORS middleware (pointless for in-process test clients, so the
+    # test factory path leaves the middleware stack empty).
+    if not testing:
+        application.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"] if settings.debug else ["localhost", "127.0.0.1"],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    # Include routes
+    application.include_router(router, prefix="/api/v1", tags=["banking"])
+
+    @application.on_event("startup")
+    def warm_database_engine() -> None:
+        """Create the engine (and its pool) as part of server startup."""
+        get_engine()
+
+    @application.on_event("shutdown")
+    def close_database_engine() -> None:
+        """Return pooled connections cleanly at shutdown."""
+        dispose_engine()
+
+    @application.on_event("startup")
+    def size_worker_threadpool() -> None:
+        """Match the request threadpool to the database pool.
+
+        The sync `def` endpoints run in AnyIO's worker threadpool, which
+        defaults to 40 threads and caps concurrent requests well below what
+        the database pool can serve. Sizing it to pool_size + max_overflow
+        lets every pooled connection be used concurrently without threads
+        queueing on checkout.
+        """
+        import anyio.to_thread
+
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = max(
+            limiter.total_tokens,
+            settings.database_pool_size + settings.database_max_overflow,
+        )
+
+    @application.get("/")
+    def root(settings: Settings = Depends(get_settings)) -> dict:
+        """Root endpoint with service information."""
+        return {
+            "name": settings.app_name,
+            "version": "0.1.0",
+            "environment": settings.app_env,
+            "documentation": {
+                "swagger_ui": "/api/docs",
+                "redoc": "/api/redoc",
+                "openapi_json": "/api/openapi.json",
+            },
+            "status": "running",
+        }
+
+    @application.get("/health", tags=["health"])
+    def health_check(settings: Settings = Depends(get_settings)) -> dict:
+        """
+        Health check endpoint.
+
+        Returns the current status of the service.
+        """
+        return {
+            "status": "healthy",
+            "service": settings.app_name,
+            "version": "0.1.0",
+        }
+
+    return application
+
+
+app = create_app(get_settings())
@@ -3,10 +3,12 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+_PASSWORD_SPECIALS = frozenset("!@#$%^&*")
 
 
 class TransactionType(str, Enum):
@@ -17,6 +19,13 @@ class TransactionType(str, Enum):
     TRANSFER = "transfer"
 
 
+class TransactionDirection(str, Enum):
+    """Direction of a transaction relative to its account."""
+
+    CREDIT = "credit"
+    DEBIT = "debit"
+
+
 class TransactionStatus(str, Enum):
     """Transaction statuses."""
 
@@ -45,15 +54,12 @@ class CardStatus(str, Enum):
 class BaseResponse(BaseModel):
     """Base response model."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
-
 
 class UserCreate(BaseModel):
     """User creation request."""
@@ -63,21 +69,28 @@ class UserCreate(BaseModel):
     first_name: str = Field(..., description="User first name")
     last_name: str = Field(..., description="User last name")
 
-    @validator("email")
+    @field_validator("email")
+    @classmethod
     def validate_email(cls, v: str) -> str:
         """Validate email format."""
         if "@" not in v or "." not in v:
             raise ValueError("Invalid email format")
         return v.lower()
 
-    @validator("password")
+    @field_validator("password")
+    @classmethod
     def validate_password(cls, v: str) -> str:
-        """Validate password strength."""
-        if not any(c.isupper() for c in v):
+        """Validate password strength in a single pass over the string."""
+        has_upper = has_digit = has_special = False
+        for c in v:
+            has_upper |= c.isupper()
+            has_digit |= c.isdigit()
+            has_special |= c in _PASSWORD_SPECIALS
+        if not has_upper:
             raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.isdigit() for c in v):
+        if not has_digit:
             raise ValueError("Password must contain at least one digit")
-        if not any(c in "!@#$%^&*" for c in v):
+        if not has_special:
             raise ValueError("Password must contain at least one special character")
         return v
 
@@ -111,7 +124,8 @@ class AccountCreate(BaseModel):
     account_type: str = Field(..., description="Type of account")
     initial_balance: Decimal = Field(default=Decimal("0.00"), ge=0)
 
-    @validator("initial_balance")
+    @field_validator("initial_balance")
+    @classmethod
     def validate_balance(cls, v: Decimal) -> Decimal:
         """Validate initial balance."""
         if v < 0:
@@ -136,7 +150,8 @@ class TransactionCreate(BaseModel):
     amount: Decimal = Field(..., gt=0)
     description: Optional[str] = None
 
-    @validator("amount")
+    @field_validator("amount")
+    @classmethod
     def validate_amount(cls, v: Decimal) -> Decimal:
         """Validate transaction amount."""
         if v <= 0:
@@ -150,7 +165,8 @@ class SimpleTransactionRequest(BaseModel):
     amount: Decimal = Field(..., gt=0)
     description: Optional[str] = None
 
-    @validator("amount")
+    @field_validator("amount")
+    @classmethod
     def validate_amount(cls, v: Decimal) -> Decimal:
         """Validate transaction amount."""
         if v <= 0:
@@ -163,6 +179,7 @@ class TransactionResponse(BaseResponse):
 
     account_id: UUID
     transaction_type: TransactionType
+    direction: TransactionDirection
     amount: Decimal
     status: TransactionStatus
     description: Optional[str]
@@ -177,7 +194,8 @@ class TransferRequest(BaseModel):
     amount: Decimal = Field(..., gt=0)
     description: Optional[str] = None
 
-    @validator("amount")
+    @field_validator("amount")
+    @classmethod
     def validate_amount(cls, v: Decimal) -> Decimal:
         """Validate transfer amount."""
         if v <= 0:
@@ -204,6 +222,14 @@ class CardResponse(BaseResponse):
     last_four: str
 
 
+class DashboardResponse(BaseModel):
+    """Composite dashboard payload: profile plus owned accounts and cards."""
+
+    user: UserResponse
+    accounts: List[AccountResponse]
+    cards: List[CardResponse]
+
+
 class StatementRequest(BaseModel):
     """Statement request."""
 
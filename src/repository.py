@@ -6,16 +6,34 @@ from decimal import Decimal
 from typing import Generic, List, Optional, TypeVar
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import case, delete as sql_delete, func, insert, select, tuple_, update as sql_update
+from sqlalchemy.orm import Session, selectinload
 
 from src.database import User, Account, Transaction, Transfer, Card, Statement
-from src.models import TransactionType, CardType, CardStatus, TransactionStatus
+from src.models import (
+    TransactionType,
+    TransactionDirection,
+    CardType,
+    CardStatus,
+    TransactionStatus,
+)
 
 T = TypeVar("T")
 
+# Built once at import so the deposit/withdrawal hot path never re-constructs
+# the INSERT; generated columns come back through RETURNING instead of a
+# post-flush refresh.
+_TRANSACTION_INSERT = insert(Transaction).returning(
+    Transaction.id, Transaction.created_at, Transaction.updated_at
+)
+
 
 class BaseRepository(ABC, Generic[T]):
-    """Base repository class for common CRUD operations."""
+    """Base repository class for common CRUD operations.
+
+    Queries use the SQLAlchemy 2.0 ``select()`` construct so compiled SQL is
+    reused from the statement cache instead of being rebuilt per call.
+    """
 
     def __init__(self, session: Session, model: type[T]) -> None:
         """Initialize repository with session and model."""
@@ -29,32 +47,43 @@ class BaseRepository(ABC, Generic[T]):
         self.session.flush()
         return db_obj
 
+    def bulk_create(self, rows: List[dict]) -> List[UUID]:
+        """Insert many rows in one round-trip and return their IDs.
+
+        Unlike looping over create(), this compiles a single INSERT and lets
+        the driver batch the parameter sets over the wire. Returned IDs are
+        guaranteed to line up with the input rows.
+        """
+        if not rows:
+            return []
+        stmt = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+        result = self.session.execute(stmt, rows)
+        return [row[0] for row in result]
+
     def get_by_id(self, obj_id: UUID) -> Optional[T]:
-        """Get object by ID."""
-        return self.session.query(self.model).filter(self.model.id == obj_id).first()
+        """Get object by ID, served from the session identity map when possible."""
+        return self.session.get(self.model, obj_id)
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
         """Get all objects with pagination."""
-        return self.session.query(self.model).offset(skip).limit(limit).all()
+        stmt = select(self.model).offset(skip).limit(limit)
+        return list(self.session.execute(stmt).scalars())
 
     def update(self, obj_id: UUID, obj_in: dict) -> Optional[T]:
-        """Update an object."""
-        obj = self.get_by_id(obj_id)
-        if not obj:
-            return None
-        for key, value in obj_in.items():
-            setattr(obj, key, value)
-        self.session.flush()
-        return obj
+        """Update an object with a single UPDATE ... RETURNING round-trip."""
+        stmt = (
+            sql_update(self.model)
+            .where(self.model.id == obj_id)
+            .values(**obj_in)
+            .returning(self.model)
+        )
+        return self.session.execute(stmt).scalar_one_or_none()
 
     def delete(self, obj_id: UUID) -> bool:
-        """Delete an object."""
-        obj = self.get_by_id(obj_id)
-        if not obj:
-            return False
-        self.session.delete(obj)
-        self.session.flush()
-        return True
+        """Delete an object without loading it first."""
+        stmt = sql_delete(self.model).where(self.model.id == obj_id)
+        result = self.session.execute(stmt)
+        return result.rowcount > 0
 
 
 class UserRepository(BaseRepository[User]):
@@ -66,17 +95,28 @@ class UserRepository(BaseRepository[User]):
 
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email address."""
-        return self.session.query(User).filter(User.email == email.lower()).first()
+        stmt = select(User).where(User.email == email.lower())
+        return self.session.execute(stmt).scalar_one_or_none()
+
+    def get_with_accounts_and_cards(self, user_id: UUID) -> Optional[User]:
+        """Get a user with accounts and cards eagerly loaded."""
+        stmt = (
+            select(User)
+            .where(User.id == user_id)
+            .options(selectinload(User.accounts), selectinload(User.cards))
+        )
+        return self.session.execute(stmt).scalar_one_or_none()
 
     def get_active_users(self, skip: int = 0, limit: int = 100) -> List[User]:
-        """Get all active users."""
-        return (
-            self.session.query(User)
-            .filter(User.is_active.is_(True))
+        """Get all active users with their accounts and cards eagerly loaded."""
+        stmt = (
+            select(User)
+            .where(User.is_active.is_(True))
+            .options(selectinload(User.accounts), selectinload(User.cards))
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(self.session.execute(stmt).scalars())
 
 
 class AccountRepository(BaseRepository[Account]):
@@ -88,23 +128,59 @@ class AccountRepository(BaseRepository[Account]):
 
     def get_by_account_number(self, account_number: str) -> Optional[Account]:
         """Get account by account number."""
-        return (
-            self.session.query(Account)
-            .filter(Account.account_number == account_number)
-            .first()
+        stmt = select(Account).where(Account.account_number == account_number)
+        return self.session.execute(stmt).scalar_one_or_none()
+
+    def get_by_id_and_holder(self, account_id: UUID, holder_id: UUID) -> Optional[Account]:
+        """Get an account only if it belongs to the given holder.
+
+        Fuses the ownership check into the fetch so authorization does not
+        cost a second round-trip.
+        """
+        stmt = select(Account).where(
+            Account.id == account_id, Account.holder_id == holder_id
+        )
+        return self.session.execute(stmt).scalar_one_or_none()
+
+    def adjust_balance(
+        self, account_id: UUID, delta: Decimal, require_funds: bool = False
+    ) -> Optional[tuple]:
+        """Atomically apply a signed delta to an active account's balance.
+
+        A single UPDATE ... RETURNING does the arithmetic in the database,
+        closing the read-modify-write window that a SELECT-then-assign flow
+        leaves open. Returns ``(balance, account_number)`` on success, or
+        None when the account is missing, inactive, or — with
+        ``require_funds`` — the delta would take the balance negative.
+        """
+        conditions = [Account.id == account_id, Account.is_active.is_(True)]
+        if require_funds:
+            conditions.append(Account.balance + delta >= 0)
+        stmt = (
+            sql_update(Account)
+            .where(*conditions)
+            .values(balance=Account.balance + delta)
+            .returning(Account.balance, Account.account_number)
         )
+        return self.session.execute(stmt).one_or_none()
 
     def get_by_holder_id(self, holder_id: UUID) -> List[Account]:
         """Get all accounts for a specific holder."""
-        return self.session.query(Account).filter(Account.holder_id == holder_id).all()
+        stmt = (
+            select(Account)
+            .where(Account.holder_id == holder_id)
+            .options(selectinload(Account.cards))
+        )
+        return list(self.session.execute(stmt).scalars())
 
     def get_active_accounts_for_holder(self, holder_id: UUID) -> List[Account]:
         """Get all active accounts for a specific holder."""
-        return (
-            self.session.query(Account)
-            .filter(Account.holder_id == holder_id, Account.is_active.is_(True))
-            .all()
+        stmt = (
+            select(Account)
+            .where(Account.holder_id == holder_id, Account.is_active.is_(True))
+            .options(selectinload(Account.cards))
         )
+        return list(self.session.execute(stmt).scalars())
 
 
 class TransactionRepository(BaseRepository[Transaction]):
@@ -114,33 +190,106 @@ class TransactionRepository(BaseRepository[Transaction]):
         """Initialize transaction repository."""
         super().__init__(session, Transaction)
 
+    def create_row(self, values: dict) -> dict:
+        """Insert a transaction via the precompiled Core statement.
+
+        Skips ORM instance construction and unit-of-work bookkeeping on the
+        service's dominant write path; the input dict is returned with the
+        database-generated columns merged in.
+        """
+        generated = self.session.execute(_TRANSACTION_INSERT, values).one()
+        row = dict(values)
+        row["id"], row["created_at"], row["updated_at"] = generated
+        return row
+
     def get_by_account_id(
         self, account_id: UUID, skip: int = 0, limit: int = 100
     ) -> List[Transaction]:
         """Get transactions for a specific account."""
-        return (
-            self.session.query(Transaction)
-            .filter(Transaction.account_id == account_id)
+        stmt = (
+            select(Transaction)
+            .where(Transaction.account_id == account_id)
             .order_by(Transaction.created_at.desc())
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(self.session.execute(stmt).scalars())
+
+    def get_by_account_id_after(
+        self,
+        account_id: UUID,
+        after_created_at: datetime,
+        after_id: UUID,
+        limit: int = 100,
+    ) -> List[Transaction]:
+        """Get the page of transactions older than a (created_at, id) cursor.
+
+        Keyset pagination: unlike OFFSET, the index range scan starts at the
+        cursor, so cost is independent of page depth. The last row of the
+        returned page is the caller's next cursor.
+        """
+        stmt = (
+            select(Transaction)
+            .where(
+                Transaction.account_id == account_id,
+                tuple_(Transaction.created_at, Transaction.id)
+                < tuple_(after_created_at, after_id),
+            )
+            .order_by(Transaction.created_at.desc(), Transaction.id.desc())
+            .limit(limit)
+        )
+        return list(self.session.execute(stmt).scalars())
+
+    def get_statement_summary(
+        self, account_id: UUID, start_date: datetime, end_date: datetime
+    ) -> tuple:
+        """Aggregate a statement period in a single round-trip.
+
+        One query returns ``(total_credits, total_debits, transaction_count,
+        opening_balance)``: the sums come from SUM(CASE) keyed on the stored
+        direction — so either leg of a transfer lands on the correct side —
+        and the opening balance rides along as a LIMIT 1 scalar subquery on
+        the newest pre-period row. Sums and opening balance are NULL for
+        empty ranges; Python never hydrates a transaction row.
+        """
+        amount_type = Transaction.amount.type
+        is_credit = Transaction.direction == TransactionDirection.CREDIT
+        credit_sum = func.sum(
+            case((is_credit, Transaction.amount), else_=0),
+            type_=amount_type,
+        )
+        debit_sum = func.sum(
+            case((is_credit, 0), else_=Transaction.amount),
+            type_=amount_type,
+        )
+        opening_balance = (
+            select(Transaction.balance_after)
+            .where(Transaction.account_id == account_id, Transaction.created_at < start_date)
+            .order_by(Transaction.created_at.desc(), Transaction.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = select(credit_sum, debit_sum, func.count(), opening_balance).where(
+            Transaction.account_id == account_id,
+            Transaction.created_at >= start_date,
+            Transaction.created_at <= end_date,
+        )
+        return self.session.execute(stmt).one()
 
     def get_by_account_id_and_date_range(
         self, account_id: UUID, start_date: datetime, end_date: datetime
     ) -> List[Transaction]:
         """Get transactions for an account within a date range."""
-        return (
-            self.session.query(Transaction)
-            .filter(
+        stmt = (
+            select(Transaction)
+            .where(
                 Transaction.account_id == account_id,
                 Transaction.created_at >= start_date,
                 Transaction.created_at <= end_date,
             )
             .order_by(Transaction.created_at.desc())
-            .all()
         )
+        return list(self.session.execute(stmt).scalars())
 
 
 class TransferRepository(BaseRepository[Transfer]):
@@ -154,27 +303,66 @@ class TransferRepository(BaseRepository[Transfer]):
         self, from_account_id: UUID, skip: int = 0, limit: int = 100
     ) -> List[Transfer]:
         """Get transfers from a specific account."""
-        return (
-            self.session.query(Transfer)
-            .filter(Transfer.from_account_id == from_account_id)
+        stmt = (
+            select(Transfer)
+            .where(Transfer.from_account_id == from_account_id)
             .order_by(Transfer.created_at.desc())
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(self.session.execute(stmt).scalars())
+
+    def get_by_from_account_id_after(
+        self,
+        from_account_id: UUID,
+        after_created_at: datetime,
+        after_id: UUID,
+        limit: int = 100,
+    ) -> List[Transfer]:
+        """Get the page of outgoing transfers older than a (created_at, id) cursor."""
+        stmt = (
+            select(Transfer)
+            .where(
+                Transfer.from_account_id == from_account_id,
+                tuple_(Transfer.created_at, Transfer.id) < tuple_(after_created_at, after_id),
+            )
+            .order_by(Transfer.created_at.desc(), Transfer.id.desc())
+            .limit(limit)
+        )
+        return list(self.session.execute(stmt).scalars())
 
     def get_by_to_account_id(
         self, to_account_id: UUID, skip: int = 0, limit: int = 100
     ) -> List[Transfer]:
         """Get transfers to a specific account."""
-        return (
-            self.session.query(Transfer)
-            .filter(Transfer.to_account_id == to_account_id)
+        stmt = (
+            select(Transfer)
+            .where(Transfer.to_account_id == to_account_id)
             .order_by(Transfer.created_at.desc())
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(self.session.execute(stmt).scalars())
+
+
+    def get_by_to_account_id_after(
+        self,
+        to_account_id: UUID,
+        after_created_at: datetime,
+        after_id: UUID,
+        limit: int = 100,
+    ) -> List[Transfer]:
+        """Get the page of incoming transfers older than a (created_at, id) cursor."""
+        stmt = (
+            select(Transfer)
+            .where(
+                Transfer.to_account_id == to_account_id,
+                tuple_(Transfer.created_at, Transfer.id) < tuple_(after_created_at, after_id),
+            )
+            .order_by(Transfer.created_at.desc(), Transfer.id.desc())
+            .limit(limit)
+        )
+        return list(self.session.execute(stmt).scalars())
 
 
 class CardRepository(BaseRepository[Card]):
@@ -186,19 +374,26 @@ class CardRepository(BaseRepository[Card]):
 
     def get_by_card_number(self, card_number: str) -> Optional[Card]:
         """Get card by card number."""
-        return self.session.query(Card).filter(Card.card_number == card_number).first()
+        stmt = select(Card).where(Card.card_number == card_number)
+        return self.session.execute(stmt).scalar_one_or_none()
 
     def get_by_holder_id(self, holder_id: UUID) -> List[Card]:
         """Get all cards for a specific holder."""
-        return self.session.query(Card).filter(Card.holder_id == holder_id).all()
+        stmt = (
+            select(Card)
+            .where(Card.holder_id == holder_id)
+            .options(selectinload(Card.account))
+        )
+        return list(self.session.execute(stmt).scalars())
 
     def get_active_cards_for_holder(self, holder_id: UUID) -> List[Card]:
         """Get all active cards for a specific holder."""
-        return (
-            self.session.query(Card)
-            .filter(Card.holder_id == holder_id, Card.status == CardStatus.ACTIVE)
-            .all()
+        stmt = (
+            select(Card)
+            .where(Card.holder_id == holder_id, Card.status == CardStatus.ACTIVE)
+            .options(selectinload(Card.account))
         )
+        return list(self.session.execute(stmt).scalars())
 
 
 class StatementRepository(BaseRepository[Statement]):
@@ -212,26 +407,45 @@ class StatementRepository(BaseRepository[Statement]):
         Statement
     ]:
         """Get statements for a specific account."""
-        return (
-            self.session.query(Statement)
-            .filter(Statement.account_id == account_id)
+        stmt = (
+            select(Statement)
+            .where(Statement.account_id == account_id)
             .order_by(Statement.start_date.desc())
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(self.session.execute(stmt).scalars())
+
+    def get_by_account_id_after(
+        self,
+        account_id: UUID,
+        after_start_date: datetime,
+        after_id: UUID,
+        limit: int = 100,
+    ) -> List[Statement]:
+        """Get the page of statements older than a (start_date, id) cursor."""
+        stmt = (
+            select(Statement)
+            .where(
+                Statement.account_id == account_id,
+                tuple_(Statement.start_date, Statement.id) < tuple_(after_start_date, after_id),
+            )
+            .order_by(Statement.start_date.desc(), Statement.id.desc())
+            .limit(limit)
+        )
+        return list(self.session.execute(stmt).scalars())
 
     def get_by_account_id_and_date_range(
         self, account_id: UUID, start_date: datetime, end_date: datetime
     ) -> List[Statement]:
         """Get statements for an account within a date range."""
-        return (
-            self.session.query(Statement)
-            .filter(
+        stmt = (
+            select(Statement)
+            .where(
                 Statement.account_id == account_id,
                 Statement.start_date >= start_date,
                 Statement.end_date <= end_date,
             )
             .order_by(Statement.start_date.desc())
-            .all()
         )
+        return list(self.session.execute(stmt).scalars())
@@ -1,11 +1,15 @@
 """API route handlers for the banking service."""
 
+import threading
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import List
+from typing import List, Optional, Tuple
 from uuid import UUID
 
+import orjson
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, Header, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from src.db import get_db
@@ -22,10 +26,11 @@ from src.models import (
     TransferRequest,
     CardCreate,
     CardResponse,
+    DashboardResponse,
     StatementRequest,
     StatementResponse,
 )
-from src.security import create_access_token, decode_access_token
+from src.security import create_access_token, decode_access_token, payload_user_id
 from src.service import (
     UserService,
     AccountService,
@@ -37,26 +42,64 @@ from src.service import (
 
 router = APIRouter()
 
+# Auth-failure responses are immutable, so the instances are built once and
+# re-raised — unauthenticated probes no longer allocate an exception each.
+_INVALID_AUTH_HEADER = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid authorization header",
+)
+_INVALID_TOKEN = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid token",
+)
+_INVALID_CURSOR = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Invalid cursor",
+)
+
+
+class _PreSerializedResponse(ORJSONResponse):
+    """ORJSON response for service-layer dicts, bypassing response_model.
+
+    The list endpoints hand back dicts the services already shaped to match
+    their response models, so re-validating every element is a second
+    Pydantic pass that finds nothing. Returning a Response directly makes
+    FastAPI skip it; response_model stays on the route for the OpenAPI
+    schema. Decimal is rendered through str, matching Pydantic's own JSON
+    form for amounts.
+    """
+
+    def render(self, content: object) -> bytes:
+        return orjson.dumps(content, default=str)
+
+
+def _parse_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a '<iso timestamp>|<uuid>' keyset cursor.
+
+    List endpoints accept the timestamp and id of the last row already
+    received; the next page starts below that point via an index seek, so
+    page cost stays flat no matter how deep the client scrolls (OFFSET
+    instead scans and discards every skipped row).
+    """
+    try:
+        raw_ts, raw_id = cursor.split("|", 1)
+        return datetime.fromisoformat(raw_ts), UUID(raw_id)
+    except ValueError as e:
+        raise _INVALID_CURSOR from e
+
 
 # Dependency to get current user from token
 def get_current_user_id(authorization: str = Header(default="")) -> UUID:
     """Extract and validate user ID from Authorization header."""
-    if not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authorization header",
-        )
+    token = authorization[7:] if authorization[:7] == "Bearer " else ""
+    if not token:
+        raise _INVALID_AUTH_HEADER
 
-    token = authorization[7:]  # Remove "Bearer " prefix
     try:
         payload = decode_access_token(token)
-        user_id = UUID(payload.get("sub"))
-        return user_id
+        return payload_user_id(payload)
     except (ValueError, KeyError) as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token",
-        ) from e
+        raise _INVALID_TOKEN from e
 
 
 # Authentication Endpoints
@@ -94,32 +137,64 @@ def login(credentials: LoginRequest, db: Session = Depends(get_db)) -> dict:
     return {"access_token": access_token, "token_type": "bearer"}
 
 
+# Short per-user cache for /auth/me: clients poll it on every dashboard
+# refresh and no endpoint mutates the profile, so a few seconds of reuse
+# removes the DB hit entirely. Same pattern as the verified-token cache.
+_ME_CACHE_TTL = 5
+_me_cache: TTLCache = TTLCache(maxsize=10000, ttl=_ME_CACHE_TTL)
+_me_cache_lock = threading.Lock()
+
+
 @router.get("/auth/me", response_model=UserResponse)
 def get_current_user(
-    authorization: str = Header(default=""),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> dict:
     """Get current user profile."""
-    user_id = get_current_user_id(authorization)
+    with _me_cache_lock:
+        user = _me_cache.get(user_id)
+    if user is not None:
+        return user
+
     service = UserService(db)
     user = service.get_user(user_id)
 
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
+    with _me_cache_lock:
+        _me_cache[user_id] = user
     return user
 
 
+@router.get("/dashboard", response_model=DashboardResponse)
+def get_dashboard(
+    user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> dict:
+    """Get the current user's profile, accounts and cards in one call.
+
+    Replaces the /auth/me + /accounts + /cards sequence a dashboard load
+    would otherwise issue: one request, one token decode, one eager-loaded
+    fetch.
+    """
+    service = UserService(db)
+    dashboard = service.get_dashboard(user_id)
+
+    if not dashboard:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+    return dashboard
+
+
 # Account Endpoints
 @router.post("/accounts", response_model=AccountResponse, status_code=status.HTTP_201_CREATED)
 def create_account(
     account_data: AccountCreate,
-    authorization: str = Header(default=""),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> dict:
     """Create a new account for the current user."""
-    user_id = get_current_user_id(authorization)
-
     try:
         service = AccountService(db)
         account = service.create_account(
@@ -135,30 +210,27 @@ def create_account(
 
 
 @router.get("/accounts", response_model=List[AccountResponse])
-def list_accounts(authorization: str = Header(default=""), db: Session = Depends(get_db)) -> List[dict]:
+def list_accounts(
+    user_id: UUID = Depends(get_current_user_id), db: Session = Depends(get_db)
+) -> ORJSONResponse:
     """List all accounts for the current user."""
-    user_id = get_current_user_id(authorization)
     service = AccountService(db)
-    return service.get_accounts_for_holder(user_id)
+    return _PreSerializedResponse(service.get_accounts_for_holder(user_id))
 
 
 @router.get("/accounts/{account_id}", response_model=AccountResponse)
 def get_account(
     account_id: UUID,
-    authorization: str = Header(default=""),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> dict:
     """Get account details."""
-    user_id = get_current_user_id(authorization)
     service = AccountService(db)
-    account = service.get_account(account_id)
+    account = service.get_account_if_owned(account_id, user_id)
 
     if not account:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
 
-    if account["holder_id"] != user_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-
     return account
 
 
@@ -171,15 +243,14 @@ def get_account(
 def deposit(
     account_id: UUID,
     transaction_data: SimpleTransactionRequest,
-    authorization: str = Header(default=""),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> dict:
     """Deposit money into an account."""
-    user_id = get_current_user_id(authorization)
     service = AccountService(db)
-    account = service.get_account(account_id)
+    account = service.get_account_if_owned(account_id, user_id)
 
-    if not account or account["holder_id"] != user_id:
+    if not account:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
     try:
@@ -204,15 +275,14 @@ def deposit(
 def withdrawal(
     account_id: UUID,
     transaction_data: SimpleTransactionRequest,
-    authorization: str = Header(default=""),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> dict:
     """Withdraw money from an account."""
-    user_id = get_current_user_id(authorization)
     service = AccountService(db)
-    account = service.get_account(account_id)
+    account = service.get_account_if_owned(account_id, user_id)
 
-    if not account or account["holder_id"] != user_id:
+    if not account:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
     try:
@@ -234,19 +304,28 @@ def get_transactions(
     account_id: UUID,
     skip: int = 0,
     limit: int = 50,
-    authorization: str = Header(default=""),
+    cursor: Optional[str] = None,
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
-) -> List[dict]:
-    """Get transactions for an account."""
-    user_id = get_current_user_id(authorization)
+) -> ORJSONResponse:
+    """Get transactions for an account.
+
+    Pass ``cursor`` (created_at|id of the last row received) for keyset
+    pagination; skip/limit remains for shallow pages.
+    """
     service = AccountService(db)
-    account = service.get_account(account_id)
+    account = service.get_account_if_owned(account_id, user_id)
 
-    if not account or account["holder_id"] != user_id:
+    if not account:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
     txn_service = TransactionService(db)
-    return txn_service.get_transactions(account_id, skip, limit)
+    if cursor is not None:
+        after_created_at, after_id = _parse_cursor(cursor)
+        return _PreSerializedResponse(
+            txn_service.get_transactions_after(account_id, after_created_at, after_id, limit)
+        )
+    return _PreSerializedResponse(txn_service.get_transactions(account_id, skip, limit))
 
 
 # Transfer Endpoints
@@ -257,15 +336,14 @@ def get_transactions(
 )
 def transfer_money(
     transfer_data: TransferRequest,
-    authorization: str = Header(default=""),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> dict:
     """Transfer money between accounts."""
-    user_id = get_current_user_id(authorization)
     acc_service = AccountService(db)
-    from_account = acc_service.get_account(transfer_data.from_account_id)
+    from_account = acc_service.get_account_if_owned(transfer_data.from_account_id, user_id)
 
-    if not from_account or from_account["holder_id"] != user_id:
+    if not from_account:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
     try:
@@ -288,19 +366,24 @@ def get_outgoing_transfers(
     account_id: UUID,
     skip: int = 0,
     limit: int = 50,
-    authorization: str = Header(default=""),
+    cursor: Optional[str] = None,
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
-) -> List[dict]:
+) -> ORJSONResponse:
     """Get outgoing transfers for an account."""
-    user_id = get_current_user_id(authorization)
     acc_service = AccountService(db)
-    account = acc_service.get_account(account_id)
+    account = acc_service.get_account_if_owned(account_id, user_id)
 
-    if not account or account["holder_id"] != user_id:
+    if not account:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
     transfer_service = TransferService(db)
-    return transfer_service.get_outgoing_transfers(account_id, skip, limit)
+    if cursor is not None:
+        after_created_at, after_id = _parse_cursor(cursor)
+        return _PreSerializedResponse(
+            transfer_service.get_outgoing_transfers_after(account_id, after_created_at, after_id, limit)
+        )
+    return _PreSerializedResponse(transfer_service.get_outgoing_transfers(account_id, skip, limit))
 
 
 @router.get("/accounts/{account_id}/transfers/incoming", response_model=List[dict])
@@ -308,19 +391,24 @@ def get_incoming_transfers(
     account_id: UUID,
     skip: int = 0,
     limit: int = 50,
-    authorization: str = Header(default=""),
+    cursor: Optional[str] = None,
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
-) -> List[dict]:
+) -> ORJSONResponse:
     """Get incoming transfers for an account."""
-    user_id = get_current_user_id(authorization)
     acc_service = AccountService(db)
-    account = acc_service.get_account(account_id)
+    account = acc_service.get_account_if_owned(account_id, user_id)
 
-    if not account or account["holder_id"] != user_id:
+    if not account:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
     transfer_service = TransferService(db)
-    return transfer_service.get_incoming_transfers(account_id, skip, limit)
+    if cursor is not None:
+        after_created_at, after_id = _parse_cursor(cursor)
+        return _PreSerializedResponse(
+            transfer_service.get_incoming_transfers_after(account_id, after_created_at, after_id, limit)
+        )
+    return _PreSerializedResponse(transfer_service.get_incoming_transfers(account_id, skip, limit))
 
 
 # Card Endpoints
@@ -331,12 +419,10 @@ def get_incoming_transfers(
 )
 def create_card(
     card_data: CardCreate,
-    authorization: str = Header(default=""),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> dict:
     """Create a new card."""
-    user_id = get_current_user_id(authorization)
-
     try:
         service = CardService(db)
         card = service.create_card(
@@ -352,26 +438,24 @@ def create_card(
 
 
 @router.get("/cards", response_model=List[CardResponse])
-def list_cards(authorization: str = Header(default=""), db: Session = Depends(get_db)) -> List[dict]:
+def list_cards(
+    user_id: UUID = Depends(get_current_user_id), db: Session = Depends(get_db)
+) -> ORJSONResponse:
     """List all cards for the current user."""
-    user_id = get_current_user_id(authorization)
     service = CardService(db)
-    return service.get_cards_for_holder(user_id)
+    return _PreSerializedResponse(service.get_cards_for_holder(user_id))
 
 
 @router.post("/cards/{card_id}/block", status_code=status.HTTP_200_OK)
 def block_card(
     card_id: UUID,
-    authorization: str = Header(default=""),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> dict:
     """Block a card."""
-    user_id = get_current_user_id(authorization)
-
     try:
         service = CardService(db)
-        card_service_instance = CardService(db)
-        card = card_service_instance.block_card(card_id)
+        card = service.block_card(card_id)
 
         if card["holder_id"] != user_id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
@@ -392,15 +476,14 @@ def block_card(
 def generate_statement(
     account_id: UUID,
     statement_request: StatementRequest,
-    authorization: str = Header(default=""),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> dict:
     """Generate a statement for an account."""
-    user_id = get_current_user_id(authorization)
     acc_service = AccountService(db)
-    account = acc_service.get_account(account_id)
+    account = acc_service.get_account_if_owned(account_id, user_id)
 
-    if not account or account["holder_id"] != user_id:
+    if not account:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
     try:
@@ -422,19 +505,27 @@ def get_statements(
     account_id: UUID,
     skip: int = 0,
     limit: int = 50,
-    authorization: str = Header(default=""),
+    cursor: Optional[str] = None,
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
-) -> List[dict]:
-    """Get statements for an account."""
-    user_id = get_current_user_id(authorization)
+) -> ORJSONResponse:
+    """Get statements for an account.
+
+    The ``cursor`` here is start_date|id of the last statement received.
+    """
     acc_service = AccountService(db)
-    account = acc_service.get_account(account_id)
+    account = acc_service.get_account_if_owned(account_id, user_id)
 
-    if not account or account["holder_id"] != user_id:
+    if not account:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
     service = StatementService(db)
-    return service.get_statements(account_id, skip, limit)
+    if cursor is not None:
+        after_start_date, after_id = _parse_cursor(cursor)
+        return _PreSerializedResponse(
+            service.get_statements_after(account_id, after_start_date, after_id, limit)
+        )
+    return _PreSerializedResponse(service.get_statements(account_id, skip, limit))
 
 
 @router.get("/health", status_code=status.HTTP_200_OK)
@@ -1,8 +1,16 @@
 """Security utilities for authentication and password hashing."""
 
+import base64
+import hashlib
+import hmac
+import json
+import os
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+from uuid import UUID
 
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
@@ -11,39 +19,140 @@ from src.config import get_settings
 settings = get_settings()
 
 # Password hashing configuration
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+_context_options = {}
+if settings.password_hash_rounds is not None:
+    _context_options["pbkdf2_sha256__rounds"] = settings.password_hash_rounds
+pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto", **_context_options)
+
+# Hashing is CPU-bound and runs in the request threadpool; without a cap a
+# burst of signups/logins can occupy every worker thread at once.
+_hash_limiter = threading.BoundedSemaphore(os.cpu_count() or 4)
+
+# Signing material resolved once at import instead of per call; the
+# algorithms list in particular was being rebuilt on every decode.
+_SIGNING_KEY = settings.secret_key
+_ALGORITHM = settings.algorithm
+_ALGORITHMS = [settings.algorithm]
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.access_token_expire_minutes)
 
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    """Hash a password."""
+    with _hash_limiter:
+        return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    with _hash_limiter:
+        return pwd_context.verify(plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    """Create a JWT access token."""
+    """Create a JWT access token.
+
+    When ``sub`` is a UUID string, a compact ``sid`` claim (base64url of the
+    raw 16 bytes) is added alongside it so verification can rebuild the UUID
+    with a straight byte copy instead of re-parsing the hex form.
+    """
     to_encode = data.copy()
 
+    sub = to_encode.get("sub")
+    if sub is not None and "sid" not in to_encode:
+        try:
+            raw = UUID(sub).bytes
+        except ValueError:
+            pass
+        else:
+            to_encode["sid"] = base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.access_token_expire_minutes
-        )
+        expire = datetime.now(timezone.utc) + _ACCESS_TOKEN_TTL
 
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=_ALGORITHM)
     return encoded_jwt
 
 
+# Verified-token cache: the same bearer token arrives on every request of a
+# session, and re-running signature verification for it is pure repeated work.
+# Entries live well under a token's 30-minute TTL; failures are never cached.
+_JWT_CACHE_TTL = 30
+_jwt_cache: TTLCache = TTLCache(maxsize=10000, ttl=_JWT_CACHE_TTL)
+_jwt_cache_lock = threading.Lock()
+
+
+def payload_user_id(payload: dict) -> UUID:
+    """Extract the user ID from a decoded token payload.
+
+    Prefers the binary ``sid`` claim — UUID(bytes=...) is a 16-byte copy,
+    versus the hex parse for ``sub`` — but falls back to ``sub`` for tokens
+    issued before ``sid`` existed.
+    """
+    sid = payload.get("sid")
+    if sid:
+        return UUID(bytes=base64.urlsafe_b64decode(sid + "=="))
+    return UUID(payload["sub"])
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode a base64url segment, restoring stripped padding."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _fast_decode_hs256(token: str) -> Optional[dict]:
+    """Verify an HS256 token with the stdlib's OpenSSL-backed HMAC.
+
+    hmac/hashlib dispatch straight to OpenSSL's SHA-256, skipping the
+    pure-Python layers jose wraps around the same primitive. Deliberately
+    conservative: returns the payload only for a well-formed, correctly
+    signed, unexpired HS256 token, and None for anything else so the jose
+    path can produce its usual errors.
+    """
+    try:
+        signing_input, _, signature = token.rpartition(".")
+        header_b64, _, payload_b64 = signing_input.partition(".")
+
+        expected = hmac.new(
+            _SIGNING_KEY.encode(), signing_input.encode(), hashlib.sha256
+        ).digest()
+        if not hmac.compare_digest(expected, _b64url_decode(signature)):
+            return None
+
+        header = json.loads(_b64url_decode(header_b64))
+        if header.get("alg") != "HS256":
+            return None
+
+        payload = json.loads(_b64url_decode(payload_b64))
+        expires_at = payload.get("exp")
+        if not expires_at or expires_at <= datetime.now(timezone.utc).timestamp():
+            return None
+        return payload
+    except (ValueError, TypeError):
+        return None
+
+
 def decode_access_token(token: str) -> dict:
     """Decode and validate a JWT access token."""
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    cache_key = hashlib.sha256(token.encode()).digest()
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(cache_key)
+    if payload is not None:
         return payload
-    except JWTError as e:
-        raise ValueError(f"Invalid token: {str(e)}") from e
+
+    payload = _fast_decode_hs256(token) if _ALGORITHM == "HS256" else None
+    if payload is None:
+        try:
+            payload = jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS)
+        except JWTError as e:
+            raise ValueError(f"Invalid token: {str(e)}") from e
+
+    # Only cache tokens that outlive the cache window, so an entry can never
+    # be served past its own expiry.
+    expires_at = payload.get("exp")
+    if expires_at and expires_at - datetime.now(timezone.utc).timestamp() > _JWT_CACHE_TTL:
+        with _jwt_cache_lock:
+            _jwt_cache[cache_key] = payload
+    return payload
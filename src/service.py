@@ -1,17 +1,26 @@
 """Service layer for business logic."""
 
-from datetime import datetime, timezone
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from operator import attrgetter
 from typing import List, Optional
 from uuid import UUID, uuid4
 
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 
 from src.database import Account, Transaction, Transfer, Card, Statement
 from src.models import (
     TransactionStatus,
     TransactionType,
+    TransactionDirection,
     CardStatus,
+    CardType,
 )
 from src.repository import (
     UserRepository,
@@ -23,6 +32,110 @@ from src.repository import (
 )
 from src.security import hash_password, verify_password
 
+# Constructing Decimal from a string is surprisingly costly; the two amounts
+# every money path needs are built once at import.
+_CENT = Decimal("0.01")
+_ZERO = Decimal("0.00")
+
+# One C-level attrgetter call per row replaces the chain of LOAD_ATTRs each
+# dict builder used to run; the key tuples keep names and values aligned.
+_USER_KEYS = ("id", "email", "first_name", "last_name", "is_active", "created_at", "updated_at")
+_USER_GET = attrgetter(*_USER_KEYS)
+_ACCOUNT_KEYS = (
+    "id",
+    "account_number",
+    "holder_id",
+    "account_type",
+    "balance",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+_ACCOUNT_GET = attrgetter(*_ACCOUNT_KEYS)
+_TXN_KEYS = (
+    "id",
+    "account_id",
+    "transaction_type",
+    "direction",
+    "amount",
+    "status",
+    "balance_after",
+    "description",
+    "created_at",
+    "updated_at",
+)
+_TXN_GET = attrgetter(*_TXN_KEYS)
+_TRANSFER_KEYS = (
+    "id",
+    "from_account_id",
+    "to_account_id",
+    "amount",
+    "status",
+    "description",
+    "from_transaction_id",
+    "to_transaction_id",
+    "created_at",
+    "updated_at",
+)
+_TRANSFER_GET = attrgetter(*_TRANSFER_KEYS)
+_CARD_KEYS = (
+    "id",
+    "card_number",
+    "card_type",
+    "status",
+    "holder_id",
+    "account_id",
+    "expiry_date",
+    "last_four",
+    "created_at",
+    "updated_at",
+)
+_CARD_GET = attrgetter(*_CARD_KEYS)
+_STATEMENT_KEYS = (
+    "id",
+    "account_id",
+    "start_date",
+    "end_date",
+    "opening_balance",
+    "closing_balance",
+    "total_credits",
+    "total_debits",
+    "transaction_count",
+    "created_at",
+    "updated_at",
+)
+_STATEMENT_GET = attrgetter(*_STATEMENT_KEYS)
+
+
+# Verified-credential cache: password verification is deliberately expensive,
+# so a client that re-authenticates with the same credentials pays the full
+# hash cost every time. Entries hold only a SHA-256 digest of the password —
+# never the password itself — next to the user dict, keyed by email.
+_AUTH_CACHE_TTL = 3600
+_auth_cache: TTLCache = TTLCache(maxsize=10000, ttl=_AUTH_CACHE_TTL)
+_auth_cache_lock = threading.Lock()
+
+
+def _invalidate_auth_cache(email: str) -> None:
+    """Drop any cached credential entry for an email."""
+    with _auth_cache_lock:
+        _auth_cache.pop(email.lower(), None)
+
+
+# Account numbers embed today's date; the strftime is recomputed at most once
+# a second instead of per account so bulk onboarding doesn't re-format the
+# same eight characters thousands of times.
+_date_prefix_cache: list = [0.0, ""]
+
+
+def _account_date_prefix() -> str:
+    """Return today's YYYYMMDD prefix, cached for up to a second."""
+    now = time.time()
+    if now - _date_prefix_cache[0] > 1.0:
+        _date_prefix_cache[0] = now
+        _date_prefix_cache[1] = datetime.now(timezone.utc).strftime("%Y%m%d")
+    return _date_prefix_cache[1]
+
 
 class UserService:
     """Service for user-related operations."""
@@ -48,14 +161,31 @@ class UserService:
                 "last_name": last_name,
             }
         )
+        _invalidate_auth_cache(email)
         return self._user_to_dict(user)
 
     def authenticate_user(self, email: str, password: str) -> Optional[dict]:
-        """Authenticate a user with email and password."""
+        """Authenticate a user with email and password.
+
+        Successful verifications are cached for a while so repeat logins
+        skip both the user fetch and the slow password hash; failures are
+        never cached. The digest comparison is constant-time.
+        """
+        key = email.lower()
+        digest = hashlib.sha256(password.encode()).digest()
+        with _auth_cache_lock:
+            entry = _auth_cache.get(key)
+        if entry is not None and hmac.compare_digest(entry[0], digest):
+            return entry[1]
+
         user = self.user_repo.get_by_email(email)
         if not user or not verify_password(password, user.hashed_password):
             return None
-        return self._user_to_dict(user)
+
+        user_dict = self._user_to_dict(user)
+        with _auth_cache_lock:
+            _auth_cache[key] = (digest, user_dict)
+        return user_dict
 
     def get_user(self, user_id: UUID) -> Optional[dict]:
         """Get user by ID."""
@@ -64,18 +194,31 @@ class UserService:
             return None
         return self._user_to_dict(user)
 
+    def get_dashboard(self, user_id: UUID) -> Optional[dict]:
+        """Get the user profile plus active accounts and cards in one fetch.
+
+        Serves the composite /dashboard endpoint so a client refresh costs
+        one request and one eager-loaded fetch instead of three of each.
+        """
+        user = self.user_repo.get_with_accounts_and_cards(user_id)
+        if not user:
+            return None
+        return {
+            "user": self._user_to_dict(user),
+            "accounts": [
+                AccountService._account_to_dict(a) for a in user.accounts if a.is_active
+            ],
+            "cards": [
+                CardService._card_to_dict(c)
+                for c in user.cards
+                if c.status == CardStatus.ACTIVE
+            ],
+        }
+
     @staticmethod
     def _user_to_dict(user) -> dict:
         """Convert user object to dictionary."""
-        return {
-            "id": user.id,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "is_active": user.is_active,
-            "created_at": user.created_at,
-            "updated_at": user.updated_at,
-        }
+        return dict(zip(_USER_KEYS, _USER_GET(user)))
 
 
 class AccountService:
@@ -88,7 +231,7 @@ class AccountService:
         self.user_repo = UserRepository(session)
 
     def create_account(
-        self, holder_id: UUID, account_type: str, initial_balance: Decimal = Decimal("0.00")
+        self, holder_id: UUID, account_type: str, initial_balance: Decimal = _ZERO
     ) -> dict:
         """Create a new account."""
         # Verify holder exists
@@ -105,7 +248,7 @@ class AccountService:
                 "account_number": account_number,
                 "holder_id": holder_id,
                 "account_type": account_type,
-                "balance": initial_balance.quantize(Decimal("0.01")),
+                "balance": initial_balance.quantize(_CENT),
             }
         )
         return self._account_to_dict(account)
@@ -117,6 +260,13 @@ class AccountService:
             return None
         return self._account_to_dict(account)
 
+    def get_account_if_owned(self, account_id: UUID, holder_id: UUID) -> Optional[dict]:
+        """Get an account only if the given holder owns it (single query)."""
+        account = self.account_repo.get_by_id_and_holder(account_id, holder_id)
+        if not account:
+            return None
+        return self._account_to_dict(account)
+
     def get_accounts_for_holder(self, holder_id: UUID) -> List[dict]:
         """Get all accounts for a holder."""
         accounts = self.account_repo.get_active_accounts_for_holder(holder_id)
@@ -132,22 +282,14 @@ class AccountService:
     @staticmethod
     def _generate_account_number() -> str:
         """Generate a unique account number."""
-        # Format: ACC-YYYYMMDDXXXXXX (16 characters after ACC-)
-        return f"ACC-{datetime.now(timezone.utc).strftime('%Y%m%d')}-{str(uuid4())[:8].upper()}"
+        # Format: ACC-YYYYMMDDXXXXXX (16 characters after ACC-); .hex skips
+        # building the dashed 36-char form just to slice 8 characters.
+        return f"ACC-{_account_date_prefix()}-{uuid4().hex[:8].upper()}"
 
     @staticmethod
     def _account_to_dict(account) -> dict:
         """Convert account object to dictionary."""
-        return {
-            "id": account.id,
-            "account_number": account.account_number,
-            "holder_id": account.holder_id,
-            "account_type": account.account_type,
-            "balance": account.balance,
-            "is_active": account.is_active,
-            "created_at": account.created_at,
-            "updated_at": account.updated_at,
-        }
+        return dict(zip(_ACCOUNT_KEYS, _ACCOUNT_GET(account)))
 
 
 class TransactionService:
@@ -164,30 +306,30 @@ class TransactionService:
         if amount <= 0:
             raise ValueError("Deposit amount must be greater than 0")
 
-        account = self.account_repo.get_by_id(account_id)
-        if not account:
-            raise ValueError(f"Account {account_id} not found")
-
-        if not account.is_active:
+        # Atomic balance update; the error path re-reads only to report why.
+        row = self.account_repo.adjust_balance(account_id, amount)
+        if row is None:
+            account = self.account_repo.get_by_id(account_id)
+            if not account:
+                raise ValueError(f"Account {account_id} not found")
             raise ValueError("Account is not active")
+        new_balance = row.balance
 
-        # Update account balance
-        new_balance = (account.balance + amount).quantize(Decimal("0.01"))
-        account.balance = new_balance
-
-        # Create transaction record
-        transaction = self.transaction_repo.create(
+        # Create transaction record via the Core fast path; no ORM instance
+        # is allocated for a row the service only echoes back as a dict.
+        row = self.transaction_repo.create_row(
             {
                 "account_id": account_id,
                 "transaction_type": TransactionType.DEPOSIT,
-                "amount": amount.quantize(Decimal("0.01")),
+                "direction": TransactionDirection.CREDIT,
+                "amount": amount.quantize(_CENT),
                 "status": TransactionStatus.COMPLETED,
                 "balance_after": new_balance,
                 "description": description,
             }
         )
 
-        return self._transaction_to_dict(transaction)
+        return self._transaction_row_to_dict(row)
 
     def withdrawal(
         self, account_id: UUID, amount: Decimal, description: Optional[str] = None
@@ -196,39 +338,51 @@ class TransactionService:
         if amount <= 0:
             raise ValueError("Withdrawal amount must be greater than 0")
 
-        account = self.account_repo.get_by_id(account_id)
-        if not account:
-            raise ValueError(f"Account {account_id} not found")
-
-        if not account.is_active:
-            raise ValueError("Account is not active")
-
-        if account.balance < amount:
+        # The funds check rides inside the UPDATE's WHERE clause, so a
+        # concurrent withdrawal cannot overdraw between check and write.
+        row = self.account_repo.adjust_balance(account_id, -amount, require_funds=True)
+        if row is None:
+            account = self.account_repo.get_by_id(account_id)
+            if not account:
+                raise ValueError(f"Account {account_id} not found")
+            if not account.is_active:
+                raise ValueError("Account is not active")
             raise ValueError("Insufficient funds")
+        new_balance = row.balance
 
-        # Update account balance
-        new_balance = (account.balance - amount).quantize(Decimal("0.01"))
-        account.balance = new_balance
-
-        # Create transaction record
-        transaction = self.transaction_repo.create(
+        # Create transaction record via the Core fast path.
+        row = self.transaction_repo.create_row(
             {
                 "account_id": account_id,
                 "transaction_type": TransactionType.WITHDRAWAL,
-                "amount": amount.quantize(Decimal("0.01")),
+                "direction": TransactionDirection.DEBIT,
+                "amount": amount.quantize(_CENT),
                 "status": TransactionStatus.COMPLETED,
                 "balance_after": new_balance,
                 "description": description,
             }
         )
 
-        return self._transaction_to_dict(transaction)
+        return self._transaction_row_to_dict(row)
 
     def get_transactions(self, account_id: UUID, skip: int = 0, limit: int = 50) -> List[dict]:
         """Get all transactions for an account."""
         transactions = self.transaction_repo.get_by_account_id(account_id, skip, limit)
         return [self._transaction_to_dict(t) for t in transactions]
 
+    def get_transactions_after(
+        self,
+        account_id: UUID,
+        after_created_at: datetime,
+        after_id: UUID,
+        limit: int = 50,
+    ) -> List[dict]:
+        """Get the page of transactions older than a (created_at, id) cursor."""
+        transactions = self.transaction_repo.get_by_account_id_after(
+            account_id, after_created_at, after_id, limit
+        )
+        return [self._transaction_to_dict(t) for t in transactions]
+
     def get_transactions_in_date_range(
         self, account_id: UUID, start_date: datetime, end_date: datetime
     ) -> List[dict]:
@@ -238,20 +392,22 @@ class TransactionService:
         )
         return [self._transaction_to_dict(t) for t in transactions]
 
+    @staticmethod
+    def _transaction_row_to_dict(row: dict) -> dict:
+        """Convert an insert-values dict to the response shape in place."""
+        row["transaction_type"] = row["transaction_type"].value
+        row["direction"] = row["direction"].value
+        row["status"] = row["status"].value
+        return row
+
     @staticmethod
     def _transaction_to_dict(transaction) -> dict:
         """Convert transaction object to dictionary."""
-        return {
-            "id": transaction.id,
-            "account_id": transaction.account_id,
-            "transaction_type": transaction.transaction_type.value if hasattr(transaction.transaction_type, 'value') else transaction.transaction_type,
-            "amount": transaction.amount,
-            "status": transaction.status.value if hasattr(transaction.status, 'value') else transaction.status,
-            "balance_after": transaction.balance_after,
-            "description": transaction.description,
-            "created_at": transaction.created_at,
-            "updated_at": transaction.updated_at,
-        }
+        row = dict(zip(_TXN_KEYS, _TXN_GET(transaction)))
+        row["transaction_type"] = row["transaction_type"].value
+        row["direction"] = row["direction"].value
+        row["status"] = row["status"].value
+        return row
 
 
 class TransferService:
@@ -278,41 +434,47 @@ class TransferService:
         if from_account_id == to_account_id:
             raise ValueError("Cannot transfer to the same account")
 
-        from_account = self.account_repo.get_by_id(from_account_id)
-        if not from_account or not from_account.is_active:
-            raise ValueError("Source account not found or inactive")
-
-        to_account = self.account_repo.get_by_id(to_account_id)
-        if not to_account or not to_account.is_active:
-            raise ValueError("Destination account not found or inactive")
-
-        if from_account.balance < amount:
-            raise ValueError("Insufficient funds in source account")
-
-        # Debit from source account
-        from_account.balance = (from_account.balance - amount).quantize(Decimal("0.01"))
-        from_transaction = self.transaction_repo.create(
-            {
-                "account_id": from_account_id,
-                "transaction_type": TransactionType.TRANSFER,
-                "amount": amount.quantize(Decimal("0.01")),
-                "status": TransactionStatus.COMPLETED,
-                "balance_after": from_account.balance,
-                "description": f"Transfer to {to_account.account_number}",
-            }
-        )
-
-        # Credit to destination account
-        to_account.balance = (to_account.balance + amount).quantize(Decimal("0.01"))
-        to_transaction = self.transaction_repo.create(
-            {
-                "account_id": to_account_id,
-                "transaction_type": TransactionType.TRANSFER,
-                "amount": amount.quantize(Decimal("0.01")),
-                "status": TransactionStatus.COMPLETED,
-                "balance_after": to_account.balance,
-                "description": f"Transfer from {from_account.account_number}",
-            }
+        # Both legs are atomic UPDATE ... RETURNING statements; validation and
+        # the funds check happen inside the debit's WHERE clause, and a failed
+        # leg is undone by the caller's rollback. Rows are always locked in
+        # ascending account-id order so two opposing transfers cannot
+        # deadlock on each other.
+        if from_account_id < to_account_id:
+            debit = self._debit_source(from_account_id, amount)
+            credit = self.account_repo.adjust_balance(to_account_id, amount)
+            if credit is None:
+                raise ValueError("Destination account not found or inactive")
+        else:
+            credit = self.account_repo.adjust_balance(to_account_id, amount)
+            if credit is None:
+                raise ValueError("Destination account not found or inactive")
+            debit = self._debit_source(from_account_id, amount)
+
+        amount_q = amount.quantize(_CENT)
+
+        # Both legs go to the database as one batched INSERT ... RETURNING
+        # instead of two separate round-trips.
+        from_txn_id, to_txn_id = self.transaction_repo.bulk_create(
+            [
+                {
+                    "account_id": from_account_id,
+                    "transaction_type": TransactionType.TRANSFER,
+                    "direction": TransactionDirection.DEBIT,
+                    "amount": amount_q,
+                    "status": TransactionStatus.COMPLETED,
+                    "balance_after": debit.balance,
+                    "description": f"Transfer to {credit.account_number}",
+                },
+                {
+                    "account_id": to_account_id,
+                    "transaction_type": TransactionType.TRANSFER,
+                    "direction": TransactionDirection.CREDIT,
+                    "amount": amount_q,
+                    "status": TransactionStatus.COMPLETED,
+                    "balance_after": credit.balance,
+                    "description": f"Transfer from {debit.account_number}",
+                },
+            ]
         )
 
         # Create transfer record
@@ -320,16 +482,26 @@ class TransferService:
             {
                 "from_account_id": from_account_id,
                 "to_account_id": to_account_id,
-                "amount": amount.quantize(Decimal("0.01")),
+                "amount": amount_q,
                 "status": TransactionStatus.COMPLETED,
                 "description": description,
-                "from_transaction_id": from_transaction.id,
-                "to_transaction_id": to_transaction.id,
+                "from_transaction_id": from_txn_id,
+                "to_transaction_id": to_txn_id,
             }
         )
 
         return self._transfer_to_dict(transfer)
 
+    def _debit_source(self, from_account_id: UUID, amount: Decimal):
+        """Debit the source account, mapping a missed UPDATE to its cause."""
+        debit = self.account_repo.adjust_balance(from_account_id, -amount, require_funds=True)
+        if debit is None:
+            from_account = self.account_repo.get_by_id(from_account_id)
+            if not from_account or not from_account.is_active:
+                raise ValueError("Source account not found or inactive")
+            raise ValueError("Insufficient funds in source account")
+        return debit
+
     def get_outgoing_transfers(
         self, from_account_id: UUID, skip: int = 0, limit: int = 50
     ) -> List[dict]:
@@ -337,6 +509,19 @@ class TransferService:
         transfers = self.transfer_repo.get_by_from_account_id(from_account_id, skip, limit)
         return [self._transfer_to_dict(t) for t in transfers]
 
+    def get_outgoing_transfers_after(
+        self,
+        from_account_id: UUID,
+        after_created_at: datetime,
+        after_id: UUID,
+        limit: int = 50,
+    ) -> List[dict]:
+        """Get the page of outgoing transfers older than a (created_at, id) cursor."""
+        transfers = self.transfer_repo.get_by_from_account_id_after(
+            from_account_id, after_created_at, after_id, limit
+        )
+        return [self._transfer_to_dict(t) for t in transfers]
+
     def get_incoming_transfers(
         self, to_account_id: UUID, skip: int = 0, limit: int = 50
     ) -> List[dict]:
@@ -344,21 +529,25 @@ class TransferService:
         transfers = self.transfer_repo.get_by_to_account_id(to_account_id, skip, limit)
         return [self._transfer_to_dict(t) for t in transfers]
 
+    def get_incoming_transfers_after(
+        self,
+        to_account_id: UUID,
+        after_created_at: datetime,
+        after_id: UUID,
+        limit: int = 50,
+    ) -> List[dict]:
+        """Get the page of incoming transfers older than a (created_at, id) cursor."""
+        transfers = self.transfer_repo.get_by_to_account_id_after(
+            to_account_id, after_created_at, after_id, limit
+        )
+        return [self._transfer_to_dict(t) for t in transfers]
+
     @staticmethod
     def _transfer_to_dict(transfer) -> dict:
         """Convert transfer object to dictionary."""
-        return {
-            "id": transfer.id,
-            "from_account_id": transfer.from_account_id,
-            "to_account_id": transfer.to_account_id,
-            "amount": transfer.amount,
-            "status": transfer.status.value if hasattr(transfer.status, 'value') else transfer.status,
-            "description": transfer.description,
-            "from_transaction_id": transfer.from_transaction_id,
-            "to_transaction_id": transfer.to_transaction_id,
-            "created_at": transfer.created_at,
-            "updated_at": transfer.updated_at,
-        }
+        row = dict(zip(_TRANSFER_KEYS, _TRANSFER_GET(transfer)))
+        row["status"] = row["status"].value
+        return row
 
 
 class CardService:
@@ -383,7 +572,9 @@ class CardService:
             {
                 "card_number": card_number,
                 "last_four": card_number[-4:],
-                "card_type": card_type,
+                # Coerce up front so the in-session instance carries the enum
+                # member, like every other enum attribute.
+                "card_type": CardType(card_type),
                 "holder_id": holder_id,
                 "account_id": account_id,
                 "expiry_date": expiry_date,
@@ -411,42 +602,29 @@ class CardService:
     @staticmethod
     def _generate_card_number() -> str:
         """Generate a unique card number."""
-        import random
-
-        # Simplified card number generation (not production-ready)
-        return "".join([str(random.randint(0, 9)) for _ in range(16)])
+        # One CSPRNG draw formatted to 16 digits: replaces 16 per-digit
+        # random.randint calls and the non-cryptographic generator.
+        return f"{secrets.randbelow(10**16):016d}"
 
     @staticmethod
     def _generate_expiry_date() -> str:
         """Generate card expiry date (5 years from now)."""
-        from datetime import timedelta
-
         expiry = datetime.now(timezone.utc) + timedelta(days=365 * 5)
         return expiry.strftime("%m/%Y")
 
     @staticmethod
     def _generate_encrypted_cvv() -> str:
         """Generate encrypted CVV (simplified)."""
-        import random
-
         # In production, this should be properly encrypted
-        return str(random.randint(100, 999))
+        return str(secrets.randbelow(900) + 100)
 
     @staticmethod
     def _card_to_dict(card) -> dict:
         """Convert card object to dictionary."""
-        return {
-            "id": card.id,
-            "card_number": card.card_number,
-            "card_type": card.card_type.value if hasattr(card.card_type, 'value') else card.card_type,
-            "status": card.status.value if hasattr(card.status, 'value') else card.status,
-            "holder_id": card.holder_id,
-            "account_id": card.account_id,
-            "expiry_date": card.expiry_date,
-            "last_four": card.last_four,
-            "created_at": card.created_at,
-            "updated_at": card.updated_at,
-        }
+        row = dict(zip(_CARD_KEYS, _CARD_GET(card)))
+        row["card_type"] = row["card_type"].value
+        row["status"] = row["status"].value
+        return row
 
 
 class StatementService:
@@ -467,38 +645,16 @@ class StatementService:
         if not account:
             raise ValueError(f"Account {account_id} not found")
 
-        # Get transactions in date range
-        transactions = self.transaction_repo.get_by_account_id_and_date_range(
-            account_id, start_date, end_date
-        )
-
-        # Calculate totals
-        total_credits = Decimal("0.00")
-        total_debits = Decimal("0.00")
-
-        for txn in transactions:
-            if txn.transaction_type in [TransactionType.DEPOSIT, TransactionType.TRANSFER]:
-                total_credits += txn.amount
-            else:
-                total_debits += txn.amount
-
-        # Get opening and closing balances
-        all_transactions = self.transaction_repo.get_by_account_id_and_date_range(
-            account_id,
-            datetime.min.replace(tzinfo=timezone.utc),
-            end_date,
+        # Totals and the opening balance come back from one aggregate query
+        # instead of hydrating any transaction rows.
+        total_credits, total_debits, transaction_count, opening_balance = (
+            self.transaction_repo.get_statement_summary(account_id, start_date, end_date)
         )
+        total_credits = total_credits or _ZERO
+        total_debits = total_debits or _ZERO
+        opening_balance = opening_balance or _ZERO
 
-        opening_balance = Decimal("0.00")
-        if all_transactions:
-            # Get balance before the statement period
-            pre_period_txns = [
-                t for t in all_transactions if t.created_at < start_date
-            ]
-            if pre_period_txns:
-                opening_balance = pre_period_txns[-1].balance_after
-
-        closing_balance = (opening_balance + total_credits - total_debits).quantize(Decimal("0.01"))
+        closing_balance = (opening_balance + total_credits - total_debits).quantize(_CENT)
 
         statement = self.statement_repo.create(
             {
@@ -507,9 +663,9 @@ class StatementService:
                 "end_date": end_date,
                 "opening_balance": opening_balance,
                 "closing_balance": closing_balance,
-                "total_credits": total_credits.quantize(Decimal("0.01")),
-                "total_debits": total_debits.quantize(Decimal("0.01")),
-                "transaction_count": str(len(transactions)),
+                "total_credits": total_credits.quantize(_CENT),
+                "total_debits": total_debits.quantize(_CENT),
+                "transaction_count": transaction_count,
             }
         )
 
@@ -520,19 +676,20 @@ class StatementService:
         statements = self.statement_repo.get_by_account_id(account_id, skip, limit)
         return [self._statement_to_dict(s) for s in statements]
 
+    def get_statements_after(
+        self,
+        account_id: UUID,
+        after_start_date: datetime,
+        after_id: UUID,
+        limit: int = 50,
+    ) -> List[dict]:
+        """Get the page of statements older than a (start_date, id) cursor."""
+        statements = self.statement_repo.get_by_account_id_after(
+            account_id, after_start_date, after_id, limit
+        )
+        return [self._statement_to_dict(s) for s in statements]
+
     @staticmethod
     def _statement_to_dict(statement) -> dict:
         """Convert statement object to dictionary."""
-        return {
-            "id": statement.id,
-            "account_id": statement.account_id,
-            "start_date": statement.start_date,
-            "end_date": statement.end_date,
-            "opening_balance": statement.opening_balance,
-            "closing_balance": statement.closing_balance,
-            "total_credits": statement.total_credits,
-            "total_debits": statement.total_debits,
-            "transaction_count": statement.transaction_count,
-            "created_at": statement.created_at,
-            "updated_at": statement.updated_at,
-        }
+        return dict(zip(_STATEMENT_KEYS, _STATEMENT_GET(statement)))
@@ -9,14 +9,12 @@ from uuid import uuid4
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool, StaticPool
 
 from src.config import Settings, get_settings
 from src.database import Base
-from src.db import get_db
-from src.main import app
 
 
 # Override settings for testing
@@ -43,47 +41,167 @@ def get_test_settings() -> TestSettings:
     return test_settings
 
 
-@pytest.fixture(scope="function")
-def test_engine():
-    """Create a test database engine for each test."""
+try:
+    import xdist  # noqa: F401
+except ImportError:
+    @pytest.fixture(scope="session")
+    def worker_id():
+        """Stand-in for the pytest-xdist fixture in single-process runs."""
+        return "master"
+
+
+@pytest.fixture(scope="session")
+def test_engine(worker_id):
+    """Create the test database engine once per worker.
+
+    Under pytest-xdist each worker gets its own named shared-cache
+    in-memory database, so `pytest -n auto` runs the suite fully in
+    parallel with no cross-worker state.
+    """
+    if worker_id == "master":
+        url = "sqlite:///:memory:"
+        poolclass = StaticPool
+    else:
+        # NullPool hands each session its own connection to the worker's
+        # shared-cache database, so a test that holds two sessions at once
+        # does not serialize on one shared connection.
+        url = f"sqlite:///file:memdb_{worker_id}?mode=memory&cache=shared&uri=true"
+        poolclass = NullPool
     engine = create_engine(
-        "sqlite:///:memory:",
+        url,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+        poolclass=poolclass,
     )
+    # A shared-cache in-memory database is dropped when its last connection
+    # closes; pin one open for the engine's lifetime under NullPool.
+    keepalive = engine.raw_connection() if poolclass is NullPool else None
+
+    # pysqlite issues implicit COMMITs around SAVEPOINT statements unless
+    # transaction control is taken away from the driver; without these two
+    # listeners the per-test savepoints would not actually nest.
+    @event.listens_for(engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
     yield engine
     Base.metadata.drop_all(bind=engine)
+    if keepalive is not None:
+        keepalive.close()
+    engine.dispose()
 
 
 @pytest.fixture(scope="function")
-def test_session_maker(test_engine):
-    """Create a test session factory for each test."""
-    return sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+def db_session(test_engine):
+    """Get a test database session isolated by an outer transaction.
 
+    The session joins an external transaction in create_savepoint mode, so
+    commits inside the test only release a SAVEPOINT; rolling back the
+    outer transaction on teardown wipes everything the test wrote without
+    re-running DDL or per-table DELETEs.
 
-@pytest.fixture(scope="function")
-def db_session(test_session_maker):
-    """Get a test database session - fresh for each test."""
-    session = test_session_maker()
+    expire_on_commit is off so objects a test still holds after a commit
+    read their cached attributes instead of issuing a refresh SELECT each.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
     try:
         yield session
     finally:
-        # Clear all tables
-        session.query = lambda x: None  # Prevent accidental queries
-        session.rollback()
         session.close()
+        transaction.rollback()
+        connection.close()
+
+
+def pytest_addoption(parser):
+    """Add the opt-in API profiling flag."""
+    parser.addoption(
+        "--profile-api",
+        action="store_true",
+        default=False,
+        help="Profile API requests with pyinstrument; HTML reports land in ./profiles/",
+    )
+
+
+def _install_profiler(app):
+    """Attach middleware that writes one pyinstrument report per request."""
+    from pathlib import Path
+
+    from pyinstrument import Profiler
+
+    out = Path("profiles")
+    out.mkdir(exist_ok=True)
+
+    @app.middleware("http")
+    async def _profile_request(request, call_next):
+        profiler = Profiler(interval=0.001, async_mode="enabled")
+        profiler.start()
+        response = await call_next(request)
+        profiler.stop()
+        name = request.url.path.strip("/").replace("/", "_") or "root"
+        (out / f"{name}.html").write_text(profiler.output_html())
+        return response
+
+
+@pytest.fixture(scope="session")
+def api_client(request):
+    """Build the TestClient (and with it the app's routing table) once.
+
+    The tests get their own app from the factory in testing mode — same
+    routes, no CORS middleware — leaving the process-global `app` and its
+    overrides untouched. Callers pair the client with a dependency
+    override for get_db; the client itself carries no per-test state.
+    """
+    from fastapi.testclient import TestClient
+
+    from src.main import create_app
+
+    application = create_app(test_settings, testing=True)
+    if request.config.getoption("--profile-api"):
+        _install_profiler(application)
+    return TestClient(application)
 
 
 @pytest.fixture(scope="function")
-def override_get_db(db_session):
-    """Override the get_db dependency."""
+def override_get_db(api_client, db_session):
+    """Override the get_db dependency on the test app."""
+    # Imported here so unit tests that never touch the API skip the full
+    # FastAPI app construction at collection time.
+    from src.db import get_db
+
     def _get_db():
         yield db_session
 
-    app.dependency_overrides[get_db] = _get_db
+    api_client.app.dependency_overrides[get_db] = _get_db
+    yield
+    api_client.app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Swap in a one-round PBKDF2 context for the whole test session.
+
+    Same scheme and verify logic as production, minus the deliberate
+    key-stretching cost - at default rounds the signup/login hashing in
+    the API tests is the suite's single largest CPU consumer.
+    """
+    from passlib.context import CryptContext
+
+    from src import security
+
+    original = security.pwd_context
+    security.pwd_context = CryptContext(schemes=["pbkdf2_sha256"], pbkdf2_sha256__rounds=1)
     yield
-    app.dependency_overrides.clear()
+    security.pwd_context = original
 
 
 @pytest.fixture(autouse=True)
@@ -96,30 +214,37 @@ def override_settings():
     config_module.get_settings = original_get_settings
 
 
-@pytest.fixture(autouse=True)
-def clear_db_before_test(db_session):
-    """Clear database before each test to ensure isolation."""
-    # Delete all data from tables in reverse order of foreign keys
-    from src.database import Statement, Transfer, Card, Transaction, Account, User
-    
-    db_session.query(Statement).delete()
-    db_session.query(Transfer).delete()
-    db_session.query(Card).delete()
-    db_session.query(Transaction).delete()
-    db_session.query(Account).delete()
-    db_session.query(User).delete()
-    db_session.commit()
-    
-    yield
-    
-    # Clean up after test
-    db_session.query(Statement).delete()
-    db_session.query(Transfer).delete()
-    db_session.query(Card).delete()
-    db_session.query(Transaction).delete()
-    db_session.query(Account).delete()
-    db_session.query(User).delete()
-    db_session.commit()
+@pytest.fixture
+def count_queries(test_engine):
+    """Context manager factory that records SQL statements sent to the DB.
+
+    Use it to assert a query budget so N+1 regressions fail in CI:
+
+        with count_queries() as queries:
+            repo.get_active_users()
+        assert len(queries) <= 2
+    """
+    from contextlib import contextmanager
+
+    from sqlalchemy import event
+
+    @contextmanager
+    def _count():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            # Transaction-control statements from the per-test savepoint
+            # isolation are not queries the code under test issued.
+            if not statement.startswith(("SAVEPOINT", "RELEASE", "ROLLBACK", "BEGIN")):
+                statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(test_engine, "before_cursor_execute", before_cursor_execute)
+
+    return _count
 
 
 @pytest.fixture
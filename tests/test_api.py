@@ -4,16 +4,105 @@ from decimal import Decimal
 from uuid import uuid4
 
 import pytest
-from fastapi.testclient import TestClient
-
-from src.main import app
-from src.security import create_access_token
-
-
-@pytest.fixture
-def client(override_get_db):
-    """Get test client."""
-    return TestClient(app)
+from sqlalchemy.orm import Session
+
+from src.db import get_db
+from src.repository import AccountRepository, UserRepository
+from src.security import create_access_token, hash_password
+
+
+@pytest.fixture(scope="module")
+def _api_connection(test_engine):
+    """Open one connection-level transaction for the whole module.
+
+    Rows created by module-scoped fixtures (signup, account setup) live
+    inside it and disappear when the module finishes.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="module")
+def _api_session(_api_connection):
+    """Session shared by every request the module's client serves."""
+    session = Session(
+        bind=_api_connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="module")
+def client(api_client, _api_session):
+    """Point the session-scoped client at this module's database session."""
+    def _get_db():
+        yield _api_session
+
+    api_client.app.dependency_overrides[get_db] = _get_db
+    yield api_client
+    api_client.app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def _rollback_between_tests(_api_connection, _api_session):
+    """Wrap each test in a savepoint so module fixtures survive teardown.
+
+    Module-scoped fixtures run before this one, so their rows sit below
+    the savepoint and persist; everything a single test writes is undone
+    by the rollback.
+    """
+    nested = _api_connection.begin_nested()
+    yield
+    _api_session.rollback()
+    if nested.is_active:
+        nested.rollback()
+    _api_session.expire_all()
+
+
+def _seed_user(session, email):
+    """Insert a user row directly through the repository."""
+    return UserRepository(session).create(
+        {
+            "email": email,
+            "hashed_password": hash_password("TestPass123!"),
+            "first_name": "John",
+            "last_name": "Doe",
+        }
+    )
+
+
+def _seed_user_token(session, email):
+    """Create a user directly and mint their JWT, skipping the HTTP auth flow.
+
+    Signup and login have their own tests in TestAuthenticationEndpoints;
+    fixtures that merely need an authenticated caller should not re-pay two
+    password hashes and two requests per module.
+    """
+    user_id = str(_seed_user(session, email).id)
+    session.commit()
+    return create_access_token({"sub": user_id})
+
+
+def _seed_account_setup(session, email):
+    """Seed a user plus one funded account and mint the JWT, all without HTTP."""
+    user = _seed_user(session, email)
+    user_id = str(user.id)
+    account = AccountRepository(session).create(
+        {
+            "account_number": f"ACC-TEST-{uuid4().hex[:8].upper()}",
+            "holder_id": user.id,
+            "account_type": "Savings",
+            "balance": Decimal("1000.00"),
+        }
+    )
+    account_id = str(account.id)
+    session.commit()
+    return create_access_token({"sub": user_id}), account_id
 
 
 class TestAuthenticationEndpoints:
@@ -109,26 +198,10 @@ class TestAuthenticationEndpoints:
 class TestAccountEndpoints:
     """Tests for account endpoints."""
 
-    @pytest.fixture
-    def auth_token(self, client):
-        """Get authentication token."""
-        client.post(
-            "/api/v1/auth/signup",
-            json={
-                "email": "test@example.com",
-                "password": "TestPass123!",
-                "first_name": "John",
-                "last_name": "Doe",
-            },
-        )
-        response = client.post(
-            "/api/v1/auth/login",
-            json={
-                "email": "test@example.com",
-                "password": "TestPass123!",
-            },
-        )
-        return response.json()["access_token"]
+    @pytest.fixture(scope="module")
+    def auth_token(self, client, _api_session):
+        """Get authentication token, once per module."""
+        return _seed_user_token(_api_session, "accounts@example.com")
 
     def test_create_account(self, client, auth_token):
         """Test account creation."""
@@ -197,42 +270,10 @@ class TestAccountEndpoints:
 class TestTransactionEndpoints:
     """Tests for transaction endpoints."""
 
-    @pytest.fixture
-    def account_setup(self, client):
-        """Setup account for transaction tests."""
-        # Signup
-        client.post(
-            "/api/v1/auth/signup",
-            json={
-                "email": "test@example.com",
-                "password": "TestPass123!",
-                "first_name": "John",
-                "last_name": "Doe",
-            },
-        )
-
-        # Login
-        login_response = client.post(
-            "/api/v1/auth/login",
-            json={
-                "email": "test@example.com",
-                "password": "TestPass123!",
-            },
-        )
-        token = login_response.json()["access_token"]
-
-        # Create account
-        account_response = client.post(
-            "/api/v1/accounts",
-            json={
-                "account_type": "Savings",
-                "initial_balance": "1000.00",
-            },
-            headers={"Authorization": f"Bearer {token}"},
-        )
-        account_id = account_response.json()["id"]
-
-        return token, account_id
+    @pytest.fixture(scope="module")
+    def account_setup(self, _api_session):
+        """Setup account for transaction tests, once per module."""
+        return _seed_account_setup(_api_session, "transactions@example.com")
 
     def test_deposit(self, client, account_setup):
         """Test deposit transaction."""
@@ -304,46 +345,58 @@ class TestTransactionEndpoints:
         assert response.status_code == 200
         assert len(response.json()) >= 1
 
+    def test_get_transactions_with_cursor(self, client, account_setup):
+        """Test keyset pagination of transactions via the cursor param."""
+        token, account_id = account_setup
 
-class TestCardEndpoints:
-    """Tests for card endpoints."""
+        for amount in ("100.00", "200.00", "300.00"):
+            client.post(
+                f"/api/v1/accounts/{account_id}/transactions/deposit",
+                json={
+                    "transaction_type": "deposit",
+                    "amount": amount,
+                },
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        first_page = client.get(
+            f"/api/v1/accounts/{account_id}/transactions?limit=2",
+            headers={"Authorization": f"Bearer {token}"},
+        ).json()
+        assert len(first_page) == 2
 
-    @pytest.fixture
-    def account_setup(self, client):
-        """Setup account for card tests."""
-        # Signup
-        client.post(
-            "/api/v1/auth/signup",
-            json={
-                "email": "test@example.com",
-                "password": "TestPass123!",
-                "first_name": "John",
-                "last_name": "Doe",
-            },
+        last = first_page[-1]
+        cursor = f"{last['created_at']}|{last['id']}"
+        response = client.get(
+            f"/api/v1/accounts/{account_id}/transactions",
+            params={"cursor": cursor},
+            headers={"Authorization": f"Bearer {token}"},
         )
+        assert response.status_code == 200
+        next_page = response.json()
+        assert len(next_page) == 1
+        assert next_page[0]["id"] not in {t["id"] for t in first_page}
 
-        # Login
-        login_response = client.post(
-            "/api/v1/auth/login",
-            json={
-                "email": "test@example.com",
-                "password": "TestPass123!",
-            },
-        )
-        token = login_response.json()["access_token"]
+    def test_get_transactions_invalid_cursor(self, client, account_setup):
+        """Test that a malformed cursor is rejected."""
+        token, account_id = account_setup
 
-        # Create account
-        account_response = client.post(
-            "/api/v1/accounts",
-            json={
-                "account_type": "Savings",
-                "initial_balance": "1000.00",
-            },
+        response = client.get(
+            f"/api/v1/accounts/{account_id}/transactions",
+            params={"cursor": "not-a-cursor"},
             headers={"Authorization": f"Bearer {token}"},
         )
-        account_id = account_response.json()["id"]
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+
+class TestCardEndpoints:
+    """Tests for card endpoints."""
 
-        return token, account_id
+    @pytest.fixture(scope="module")
+    def account_setup(self, _api_session):
+        """Setup account for card tests, once per module."""
+        return _seed_account_setup(_api_session, "cards@example.com")
 
     def test_create_card(self, client, account_setup):
         """Test card creation."""
@@ -384,6 +437,62 @@ class TestCardEndpoints:
         assert len(response.json()) >= 1
 
 
+class TestDashboardEndpoint:
+    """Tests for the composite dashboard endpoint."""
+
+    def test_get_dashboard(self, client):
+        """Test fetching profile, accounts and cards in one call."""
+        client.post(
+            "/api/v1/auth/signup",
+            json={
+                "email": "test@example.com",
+                "password": "TestPass123!",
+                "first_name": "John",
+                "last_name": "Doe",
+            },
+        )
+        login_response = client.post(
+            "/api/v1/auth/login",
+            json={
+                "email": "test@example.com",
+                "password": "TestPass123!",
+            },
+        )
+        token = login_response.json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        account_response = client.post(
+            "/api/v1/accounts",
+            json={
+                "account_type": "Savings",
+                "initial_balance": "1000.00",
+            },
+            headers=headers,
+        )
+        account_id = account_response.json()["id"]
+        client.post(
+            "/api/v1/cards",
+            json={
+                "card_type": "debit",
+                "account_id": account_id,
+            },
+            headers=headers,
+        )
+
+        response = client.get("/api/v1/dashboard", headers=headers)
+        assert response.status_code == 200
+        dashboard = response.json()
+        assert dashboard["user"]["email"] == "test@example.com"
+        assert len(dashboard["accounts"]) == 1
+        assert dashboard["accounts"][0]["balance"] == "1000.00"
+        assert len(dashboard["cards"]) == 1
+
+    def test_get_dashboard_requires_auth(self, client):
+        """Test that the dashboard rejects unauthenticated requests."""
+        response = client.get("/api/v1/dashboard")
+        assert response.status_code == 401
+
+
 class TestHealthEndpoint:
     """Tests for health check endpoint."""
 
@@ -18,76 +18,43 @@ from src.models import (
 class TestUserCreate:
     """Tests for UserCreate model."""
 
+    # Shared baseline kwargs; individual tests override a single field.
+    BASE = {
+        "email": "test@example.com",
+        "password": "TestPass123!",
+        "first_name": "John",
+        "last_name": "Doe",
+    }
+
     def test_user_create_valid(self):
         """Test creating a valid user."""
-        user = UserCreate(
-            email="test@example.com",
-            password="TestPass123!",
-            first_name="John",
-            last_name="Doe",
-        )
+        user = UserCreate(**self.BASE)
         assert user.email == "test@example.com"
         assert user.first_name == "John"
 
     def test_user_create_email_lowercase(self):
         """Test that email is converted to lowercase."""
-        user = UserCreate(
-            email="TEST@EXAMPLE.COM",
-            password="TestPass123!",
-            first_name="John",
-            last_name="Doe",
-        )
+        user = UserCreate(**{**self.BASE, "email": "TEST@EXAMPLE.COM"})
         assert user.email == "test@example.com"
 
     def test_user_create_invalid_email(self):
         """Test that invalid email raises error."""
         with pytest.raises(ValueError, match="Invalid email format"):
-            UserCreate(
-                email="invalid-email",
-                password="TestPass123!",
-                first_name="John",
-                last_name="Doe",
-            )
-
-    def test_user_create_weak_password_no_uppercase(self):
-        """Test that password without uppercase raises error."""
-        with pytest.raises(ValueError, match="uppercase letter"):
-            UserCreate(
-                email="test@example.com",
-                password="testpass123!",
-                first_name="John",
-                last_name="Doe",
-            )
-
-    def test_user_create_weak_password_no_digit(self):
-        """Test that password without digit raises error."""
-        with pytest.raises(ValueError, match="digit"):
-            UserCreate(
-                email="test@example.com",
-                password="TestPass!",
-                first_name="John",
-                last_name="Doe",
-            )
-
-    def test_user_create_weak_password_no_special_char(self):
-        """Test that password without special character raises error."""
-        with pytest.raises(ValueError, match="special character"):
-            UserCreate(
-                email="test@example.com",
-                password="TestPass123",
-                first_name="John",
-                last_name="Doe",
-            )
-
-    def test_user_create_password_too_short(self):
-        """Test that short password raises error."""
-        with pytest.raises(ValueError):
-            UserCreate(
-                email="test@example.com",
-                password="TPass1!",
-                first_name="John",
-                last_name="Doe",
-            )
+            UserCreate(**{**self.BASE, "email": "invalid-email"})
+
+    @pytest.mark.parametrize(
+        "password,match",
+        [
+            ("testpass123!", "uppercase letter"),
+            ("TestPass!", "digit"),
+            ("TestPass123", "special character"),
+            ("TPass1!", ""),  # too short; message comes from the length rule
+        ],
+    )
+    def test_user_create_weak_password(self, password, match):
+        """Test that weak passwords raise the matching error."""
+        with pytest.raises(ValueError, match=match):
+            UserCreate(**{**self.BASE, "password": password})
 
 
 class TestAccountCreate:
@@ -137,20 +104,19 @@ class TestTransactionCreate:
         assert transaction.transaction_type == TransactionType.DEPOSIT
         assert transaction.amount == Decimal("100.00")
 
-    def test_transaction_create_zero_amount(self):
-        """Test that zero amount raises error."""
-        with pytest.raises(ValueError, match="greater than 0"):
-            TransactionCreate(
-                transaction_type=TransactionType.DEPOSIT,
-                amount=Decimal("0.00"),
-            )
-
-    def test_transaction_create_negative_amount(self):
-        """Test that negative amount raises error."""
+    @pytest.mark.parametrize(
+        "transaction_type,amount",
+        [
+            (TransactionType.DEPOSIT, Decimal("0.00")),
+            (TransactionType.WITHDRAWAL, Decimal("-50.00")),
+        ],
+    )
+    def test_transaction_create_non_positive_amount(self, transaction_type, amount):
+        """Test that zero or negative amounts raise errors."""
         with pytest.raises(ValueError, match="greater than 0"):
             TransactionCreate(
-                transaction_type=TransactionType.WITHDRAWAL,
-                amount=Decimal("-50.00"),
+                transaction_type=transaction_type,
+                amount=amount,
             )
 
     def test_transaction_create_amount_quantization(self):
@@ -178,20 +144,12 @@ class TestTransferRequest:
         assert transfer.to_account_id == to_id
         assert transfer.amount == Decimal("500.00")
 
-    def test_transfer_request_zero_amount(self):
-        """Test that zero amount raises error."""
-        with pytest.raises(ValueError, match="greater than 0"):
-            TransferRequest(
-                from_account_id=uuid4(),
-                to_account_id=uuid4(),
-                amount=Decimal("0.00"),
-            )
-
-    def test_transfer_request_negative_amount(self):
-        """Test that negative amount raises error."""
+    @pytest.mark.parametrize("amount", [Decimal("0.00"), Decimal("-100.00")])
+    def test_transfer_request_non_positive_amount(self, amount):
+        """Test that zero or negative amounts raise errors."""
         with pytest.raises(ValueError, match="greater than 0"):
             TransferRequest(
                 from_account_id=uuid4(),
                 to_account_id=uuid4(),
-                amount=Decimal("-100.00"),
+                amount=amount,
             )
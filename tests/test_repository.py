@@ -1,13 +1,15 @@
 """Unit tests for repository layer."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta
 from decimal import Decimal
-from uuid import uuid4
 
-import pytest
-
-from src.database import User, Account, Transaction, Card
-from src.models import TransactionType, TransactionStatus, CardType, CardStatus
+from src.models import (
+    TransactionType,
+    TransactionDirection,
+    TransactionStatus,
+    CardType,
+    CardStatus,
+)
 from src.repository import (
     UserRepository,
     AccountRepository,
@@ -16,6 +18,10 @@ from src.repository import (
 )
 from src.security import hash_password
 
+# Every seeded user shares one credential; hash it once per worker instead
+# of once per test body.
+HASHED_PW = hash_password("TestPass123!")
+
 
 class TestUserRepository:
     """Tests for UserRepository."""
@@ -25,7 +31,7 @@ class TestUserRepository:
         repo = UserRepository(db_session)
         user_data = {
             "email": "test@example.com",
-            "hashed_password": hash_password("TestPass123!"),
+            "hashed_password": HASHED_PW,
             "first_name": "John",
             "last_name": "Doe",
         }
@@ -41,7 +47,7 @@ class TestUserRepository:
         repo = UserRepository(db_session)
         user_data = {
             "email": "test@example.com",
-            "hashed_password": hash_password("TestPass123!"),
+            "hashed_password": HASHED_PW,
             "first_name": "John",
             "last_name": "Doe",
         }
@@ -57,7 +63,7 @@ class TestUserRepository:
         repo = UserRepository(db_session)
         user_data = {
             "email": "test@example.com",
-            "hashed_password": hash_password("TestPass123!"),
+            "hashed_password": HASHED_PW,
             "first_name": "John",
             "last_name": "Doe",
         }
@@ -68,30 +74,75 @@ class TestUserRepository:
         assert user is not None
         assert user.email == "test@example.com"
 
+    def test_bulk_create_users(self, db_session):
+        """Test creating many users in a single insert."""
+        repo = UserRepository(db_session)
+        hashed = HASHED_PW
+        rows = [
+            {
+                "email": f"user{i}@example.com",
+                "hashed_password": hashed,
+                "first_name": "User",
+                "last_name": str(i),
+            }
+            for i in range(3)
+        ]
+        ids = repo.bulk_create(rows)
+        db_session.commit()
+
+        assert len(ids) == 3
+        assert len(repo.get_all()) == 3
+
     def test_get_active_users(self, db_session):
         """Test getting active users."""
         repo = UserRepository(db_session)
-        user_data_1 = {
-            "email": "user1@example.com",
-            "hashed_password": hash_password("TestPass123!"),
-            "first_name": "User",
-            "last_name": "One",
-        }
-        user_data_2 = {
-            "email": "user2@example.com",
-            "hashed_password": hash_password("TestPass123!"),
-            "first_name": "User",
-            "last_name": "Two",
-            "is_active": False,
-        }
-        repo.create(user_data_1)
-        repo.create(user_data_2)
+        repo.bulk_create(
+            [
+                {
+                    "email": "user1@example.com",
+                    "hashed_password": HASHED_PW,
+                    "first_name": "User",
+                    "last_name": "One",
+                },
+                {
+                    "email": "user2@example.com",
+                    "hashed_password": HASHED_PW,
+                    "first_name": "User",
+                    "last_name": "Two",
+                    "is_active": False,
+                },
+            ]
+        )
         db_session.commit()
 
         active_users = repo.get_active_users()
         assert len(active_users) == 1
         assert active_users[0].email == "user1@example.com"
 
+    def test_get_active_users_query_budget(self, db_session, count_queries):
+        """Test that listing users stays within its query budget."""
+        repo = UserRepository(db_session)
+        repo.bulk_create(
+            [
+                {
+                    "email": f"user{i}@example.com",
+                    "hashed_password": HASHED_PW,
+                    "first_name": "User",
+                    "last_name": str(i),
+                }
+                for i in range(5)
+            ]
+        )
+        db_session.commit()
+
+        # One SELECT for users plus one selectinload batch per relationship,
+        # regardless of how many users are returned.
+        with count_queries() as queries:
+            users = repo.get_active_users()
+            for user in users:
+                _ = list(user.accounts), list(user.cards)
+        assert len(queries) <= 3
+
 
 class TestAccountRepository:
     """Tests for AccountRepository."""
@@ -103,7 +154,7 @@ class TestAccountRepository:
         user = user_repo.create(
             {
                 "email": "test@example.com",
-                "hashed_password": hash_password("TestPass123!"),
+                "hashed_password": HASHED_PW,
                 "first_name": "John",
                 "last_name": "Doe",
             }
@@ -131,7 +182,7 @@ class TestAccountRepository:
         user = user_repo.create(
             {
                 "email": "test@example.com",
-                "hashed_password": hash_password("TestPass123!"),
+                "hashed_password": HASHED_PW,
                 "first_name": "John",
                 "last_name": "Doe",
             }
@@ -161,7 +212,7 @@ class TestAccountRepository:
         user = user_repo.create(
             {
                 "email": "test@example.com",
-                "hashed_password": hash_password("TestPass123!"),
+                "hashed_password": HASHED_PW,
                 "first_name": "John",
                 "last_name": "Doe",
             }
@@ -169,21 +220,21 @@ class TestAccountRepository:
         db_session.commit()
 
         acc_repo = AccountRepository(db_session)
-        acc_repo.create(
-            {
-                "account_number": "ACC-001",
-                "holder_id": user.id,
-                "account_type": "Savings",
-                "balance": Decimal("1000.00"),
-            }
-        )
-        acc_repo.create(
-            {
-                "account_number": "ACC-002",
-                "holder_id": user.id,
-                "account_type": "Checking",
-                "balance": Decimal("500.00"),
-            }
+        acc_repo.bulk_create(
+            [
+                {
+                    "account_number": "ACC-001",
+                    "holder_id": user.id,
+                    "account_type": "Savings",
+                    "balance": Decimal("1000.00"),
+                },
+                {
+                    "account_number": "ACC-002",
+                    "holder_id": user.id,
+                    "account_type": "Checking",
+                    "balance": Decimal("500.00"),
+                },
+            ]
         )
         db_session.commit()
 
@@ -202,7 +253,7 @@ class TestTransactionRepository:
         user = user_repo.create(
             {
                 "email": "test@example.com",
-                "hashed_password": hash_password("TestPass123!"),
+                "hashed_password": HASHED_PW,
                 "first_name": "John",
                 "last_name": "Doe",
             }
@@ -222,23 +273,25 @@ class TestTransactionRepository:
 
         # Create transactions
         txn_repo = TransactionRepository(db_session)
-        txn_repo.create(
-            {
-                "account_id": account.id,
-                "transaction_type": TransactionType.DEPOSIT,
-                "amount": Decimal("100.00"),
-                "status": TransactionStatus.COMPLETED,
-                "balance_after": Decimal("1100.00"),
-            }
-        )
-        txn_repo.create(
-            {
-                "account_id": account.id,
-                "transaction_type": TransactionType.WITHDRAWAL,
-                "amount": Decimal("50.00"),
-                "status": TransactionStatus.COMPLETED,
-                "balance_after": Decimal("1050.00"),
-            }
+        txn_repo.bulk_create(
+            [
+                {
+                    "account_id": account.id,
+                    "transaction_type": TransactionType.DEPOSIT,
+                    "direction": TransactionDirection.CREDIT,
+                    "amount": Decimal("100.00"),
+                    "status": TransactionStatus.COMPLETED,
+                    "balance_after": Decimal("1100.00"),
+                },
+                {
+                    "account_id": account.id,
+                    "transaction_type": TransactionType.WITHDRAWAL,
+                    "direction": TransactionDirection.DEBIT,
+                    "amount": Decimal("50.00"),
+                    "status": TransactionStatus.COMPLETED,
+                    "balance_after": Decimal("1050.00"),
+                },
+            ]
         )
         db_session.commit()
 
@@ -248,6 +301,59 @@ class TestTransactionRepository:
         assert transactions[0].transaction_type == TransactionType.WITHDRAWAL
         assert transactions[1].transaction_type == TransactionType.DEPOSIT
 
+    def test_get_transactions_after_cursor(self, db_session):
+        """Test keyset pagination with a (created_at, id) cursor."""
+        # Setup user and account
+        user_repo = UserRepository(db_session)
+        user = user_repo.create(
+            {
+                "email": "test@example.com",
+                "hashed_password": HASHED_PW,
+                "first_name": "John",
+                "last_name": "Doe",
+            }
+        )
+        db_session.commit()
+
+        acc_repo = AccountRepository(db_session)
+        account = acc_repo.create(
+            {
+                "account_number": "ACC-001",
+                "holder_id": user.id,
+                "account_type": "Savings",
+                "balance": Decimal("1000.00"),
+            }
+        )
+        db_session.commit()
+
+        # Create transactions with distinct timestamps
+        txn_repo = TransactionRepository(db_session)
+        base = datetime(2024, 1, 1, 12, 0, 0)
+        for i in range(3):
+            txn_repo.create(
+                {
+                    "account_id": account.id,
+                    "transaction_type": TransactionType.DEPOSIT,
+                    "direction": TransactionDirection.CREDIT,
+                    "amount": Decimal("100.00"),
+                    "status": TransactionStatus.COMPLETED,
+                    "balance_after": Decimal("1000.00") + Decimal(100 * (i + 1)),
+                    "created_at": base + timedelta(minutes=i),
+                }
+            )
+        db_session.commit()
+
+        # First page is the newest transaction; its row is the next cursor
+        first_page = txn_repo.get_by_account_id(account.id, limit=1)
+        assert len(first_page) == 1
+        cursor = first_page[0]
+
+        next_page = txn_repo.get_by_account_id_after(
+            account.id, cursor.created_at, cursor.id, limit=10
+        )
+        assert len(next_page) == 2
+        assert all(t.created_at < cursor.created_at for t in next_page)
+
 
 class TestCardRepository:
     """Tests for CardRepository."""
@@ -259,7 +365,7 @@ class TestCardRepository:
         user = user_repo.create(
             {
                 "email": "test@example.com",
-                "hashed_password": hash_password("TestPass123!"),
+                "hashed_password": HASHED_PW,
                 "first_name": "John",
                 "last_name": "Doe",
             }
@@ -279,29 +385,29 @@ class TestCardRepository:
 
         # Create cards
         card_repo = CardRepository(db_session)
-        card_repo.create(
-            {
-                "card_number": "1234567890123456",
-                "last_four": "3456",
-                "card_type": CardType.DEBIT,
-                "holder_id": user.id,
-                "account_id": account.id,
-                "expiry_date": "12/2028",
-                "cvv": "encrypted_cvv",
-                "status": CardStatus.ACTIVE,
-            }
-        )
-        card_repo.create(
-            {
-                "card_number": "6543210987654321",
-                "last_four": "4321",
-                "card_type": CardType.CREDIT,
-                "holder_id": user.id,
-                "account_id": account.id,
-                "expiry_date": "06/2027",
-                "cvv": "encrypted_cvv",
-                "status": CardStatus.BLOCKED,
-            }
+        card_repo.bulk_create(
+            [
+                {
+                    "card_number": "1234567890123456",
+                    "last_four": "3456",
+                    "card_type": CardType.DEBIT,
+                    "holder_id": user.id,
+                    "account_id": account.id,
+                    "expiry_date": "12/2028",
+                    "cvv": "encrypted_cvv",
+                    "status": CardStatus.ACTIVE,
+                },
+                {
+                    "card_number": "6543210987654321",
+                    "last_four": "4321",
+                    "card_type": CardType.CREDIT,
+                    "holder_id": user.id,
+                    "account_id": account.id,
+                    "expiry_date": "06/2027",
+                    "cvv": "encrypted_cvv",
+                    "status": CardStatus.BLOCKED,
+                },
+            ]
         )
         db_session.commit()
 
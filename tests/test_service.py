@@ -1,12 +1,13 @@
 """Unit tests for service layer."""
 
+import re
 from decimal import Decimal
-from uuid import uuid4, UUID
+from uuid import uuid4
 
 import pytest
+from sqlalchemy import insert
 
-from src.database import User
-from src.repository import UserRepository
+from src.database import Account, User
 from src.security import hash_password
 from src.service import (
     UserService,
@@ -17,14 +18,116 @@ from src.service import (
 )
 from src.models import TransactionType, CardType
 
+# Seeded users share one credential; hash it once at import time instead
+# of once per test body.
+HASHED_PW = hash_password("TestPass123!")
+
+# The same handful of amounts recurs throughout; parse each literal once.
+_D0 = Decimal("0.00")
+_D50 = Decimal("50.00")
+_D100 = Decimal("100.00")
+_D400 = Decimal("400.00")
+_D500 = Decimal("500.00")
+_D1000 = Decimal("1000.00")
+_DN100 = Decimal("-100.00")
+
+# Expected-error patterns, compiled once instead of per pytest.raises call.
+_RX_EXISTS = re.compile("already exists")
+_RX_NOT_FOUND = re.compile("not found")
+_RX_NEG = re.compile("cannot be negative")
+_RX_INSUF = re.compile("Insufficient funds")
+_RX_SAME = re.compile("same account")
+
+
+def _seed_user(db_session, email="test@example.com"):
+    """Insert a scaffolding user with a single Core INSERT.
+
+    Tests that only need a holder for accounts/cards don't exercise
+    UserService.create_user, so skip the ORM unit of work entirely and
+    hand back the pre-generated id.
+    """
+    user_id = uuid4()
+    db_session.execute(
+        insert(User),
+        {
+            "id": user_id,
+            "email": email,
+            "hashed_password": HASHED_PW,
+            "first_name": "John",
+            "last_name": "Doe",
+        },
+    )
+    db_session.commit()
+    return user_id
+
+
+def _seed_user_account(db_session, balance=_D1000):
+    """Insert a user and account as two Core INSERTs, no identity map.
+
+    Account creation has its own tests; the transaction, transfer and
+    card tests only need the rows to exist.
+    """
+    user_id, account_id = uuid4(), uuid4()
+    db_session.execute(
+        insert(User),
+        {
+            "id": user_id,
+            "email": "test@example.com",
+            "hashed_password": HASHED_PW,
+            "first_name": "John",
+            "last_name": "Doe",
+        },
+    )
+    db_session.execute(
+        insert(Account),
+        {
+            "id": account_id,
+            "account_number": f"ACC-TEST-{uuid4().hex[:8].upper()}",
+            "holder_id": user_id,
+            "account_type": "Savings",
+            "balance": balance,
+        },
+    )
+    db_session.commit()
+    return user_id, account_id
+
+
+@pytest.fixture
+def user_service(db_session):
+    """UserService bound to the test session."""
+    return UserService(db_session)
+
+
+@pytest.fixture
+def acc_service(db_session):
+    """AccountService bound to the test session."""
+    return AccountService(db_session)
+
+
+@pytest.fixture
+def txn_service(db_session):
+    """TransactionService bound to the test session."""
+    return TransactionService(db_session)
+
+
+@pytest.fixture
+def transfer_service(db_session):
+    """TransferService bound to the test session."""
+    return TransferService(db_session)
+
+
+@pytest.fixture
+def card_service(db_session):
+    """CardService bound to the test session."""
+    return CardService(db_session)
+
 
 class TestUserService:
     """Tests for UserService."""
 
-    def test_create_user(self, db_session):
+    def test_create_user(self, db_session, user_service):
         """Test creating a user."""
-        service = UserService(db_session)
-        user = service.create_user(
+        user = user_service.create_user(
             email="test@example.com",
             password="TestPass123!",
             first_name="John",
@@ -35,54 +138,48 @@ class TestUserService:
         assert user["email"] == "test@example.com"
         assert user["first_name"] == "John"
 
-    def test_create_duplicate_user(self, db_session):
+    def test_create_duplicate_user(self, user_service):
         """Test that duplicate email raises error."""
-        service = UserService(db_session)
-        service.create_user(
+        user_service.create_user(
             email="test@example.com",
             password="TestPass123!",
             first_name="John",
             last_name="Doe",
         )
-        db_session.commit()
 
-        with pytest.raises(ValueError, match="already exists"):
-            service.create_user(
+        with pytest.raises(ValueError, match=_RX_EXISTS):
+            user_service.create_user(
                 email="test@example.com",
                 password="TestPass456!",
                 first_name="Jane",
                 last_name="Doe",
             )
 
-    def test_authenticate_user(self, db_session):
+    def test_authenticate_user(self, user_service):
         """Test authenticating a user."""
-        service = UserService(db_session)
-        service.create_user(
+        user_service.create_user(
             email="test@example.com",
             password="TestPass123!",
             first_name="John",
             last_name="Doe",
         )
-        db_session.commit()
 
-        user = service.authenticate_user(
+        user = user_service.authenticate_user(
             email="test@example.com", password="TestPass123!"
         )
         assert user is not None
         assert user["email"] == "test@example.com"
 
-    def test_authenticate_user_wrong_password(self, db_session):
+    def test_authenticate_user_wrong_password(self, user_service):
         """Test authentication with wrong password."""
-        service = UserService(db_session)
-        service.create_user(
+        user_service.create_user(
             email="test@example.com",
             password="TestPass123!",
             first_name="John",
             last_name="Doe",
         )
-        db_session.commit()
 
-        user = service.authenticate_user(
+        user = user_service.authenticate_user(
             email="test@example.com", password="WrongPass123!"
         )
         assert user is None
@@ -91,261 +188,127 @@ class TestUserService:
 class TestAccountService:
     """Tests for AccountService."""
 
-    def test_create_account(self, db_session):
+    def test_create_account(self, db_session, acc_service):
         """Test creating an account."""
-        # Create user first
-        user_service = UserService(db_session)
-        user = user_service.create_user(
-            email="test@example.com",
-            password="TestPass123!",
-            first_name="John",
-            last_name="Doe",
-        )
-        db_session.commit()
+        user_id = _seed_user(db_session)
 
-        # Create account
-        acc_service = AccountService(db_session)
         account = acc_service.create_account(
-            holder_id=UUID(hex=user["id"].hex),
+            holder_id=user_id,
             account_type="Savings",
-            initial_balance=Decimal("1000.00"),
+            initial_balance=_D1000,
         )
         db_session.commit()
 
         assert account["account_type"] == "Savings"
-        assert account["balance"] == Decimal("1000.00")
+        assert account["balance"] == _D1000
 
-    def test_create_account_nonexistent_user(self, db_session):
+    def test_create_account_nonexistent_user(self, acc_service):
         """Test creating account for nonexistent user."""
-        service = AccountService(db_session)
-        with pytest.raises(ValueError, match="not found"):
-            service.create_account(
+        with pytest.raises(ValueError, match=_RX_NOT_FOUND):
+            acc_service.create_account(
                 holder_id=uuid4(),
                 account_type="Savings",
-                initial_balance=Decimal("1000.00"),
+                initial_balance=_D1000,
             )
 
-    def test_create_account_negative_balance(self, db_session):
+    def test_create_account_negative_balance(self, db_session, acc_service):
         """Test creating account with negative balance."""
-        # Create user
-        user_service = UserService(db_session)
-        user = user_service.create_user(
-            email="test@example.com",
-            password="TestPass123!",
-            first_name="John",
-            last_name="Doe",
-        )
-        db_session.commit()
+        user_id = _seed_user(db_session)
 
-        service = AccountService(db_session)
-        with pytest.raises(ValueError, match="cannot be negative"):
-            service.create_account(
-                holder_id=UUID(hex=user["id"].hex),
+        with pytest.raises(ValueError, match=_RX_NEG):
+            acc_service.create_account(
+                holder_id=user_id,
                 account_type="Savings",
-                initial_balance=Decimal("-100.00"),
+                initial_balance=_DN100,
             )
 
 
 class TestTransactionService:
     """Tests for TransactionService."""
 
-    def test_deposit(self, db_session):
-        """Test deposit transaction."""
-        # Setup
-        user_service = UserService(db_session)
-        user = user_service.create_user(
-            email="test@example.com",
-            password="TestPass123!",
-            first_name="John",
-            last_name="Doe",
-        )
-        db_session.commit()
-
-        acc_service = AccountService(db_session)
-        account = acc_service.create_account(
-            holder_id=UUID(hex=user["id"].hex),
-            account_type="Savings",
-            initial_balance=Decimal("0.00"),
-        )
-        db_session.commit()
-
-        # Test
-        txn_service = TransactionService(db_session)
-        transaction = txn_service.deposit(
-            account_id=UUID(hex=account["id"].hex),
-            amount=Decimal("100.00"),
-        )
-        db_session.commit()
-
-        assert transaction["transaction_type"] == "deposit"
-        assert transaction["amount"] == Decimal("100.00")
-        assert transaction["balance_after"] == Decimal("100.00")
-
-    def test_withdrawal(self, db_session):
-        """Test withdrawal transaction."""
-        # Setup
-        user_service = UserService(db_session)
-        user = user_service.create_user(
-            email="test@example.com",
-            password="TestPass123!",
-            first_name="John",
-            last_name="Doe",
-        )
-        db_session.commit()
-
-        acc_service = AccountService(db_session)
-        account = acc_service.create_account(
-            holder_id=UUID(hex=user["id"].hex),
-            account_type="Savings",
-            initial_balance=Decimal("500.00"),
-        )
-        db_session.commit()
-
-        # Test
-        txn_service = TransactionService(db_session)
-        transaction = txn_service.withdrawal(
-            account_id=UUID(hex=account["id"].hex),
-            amount=Decimal("100.00"),
-        )
-        db_session.commit()
-
-        assert transaction["transaction_type"] == "withdrawal"
-        assert transaction["amount"] == Decimal("100.00")
-        assert transaction["balance_after"] == Decimal("400.00")
-
-    def test_withdrawal_insufficient_funds(self, db_session):
-        """Test withdrawal with insufficient funds."""
-        # Setup
-        user_service = UserService(db_session)
-        user = user_service.create_user(
-            email="test@example.com",
-            password="TestPass123!",
-            first_name="John",
-            last_name="Doe",
-        )
+    @pytest.mark.parametrize(
+        "op,balance,amount,balance_after,error",
+        [
+            ("deposit", _D0, _D100, _D100, None),
+            ("withdrawal", _D500, _D100, _D400, None),
+            ("withdrawal", _D50, _D100, None, _RX_INSUF),
+        ],
+    )
+    def test_transaction(self, db_session, txn_service, op, balance, amount, balance_after, error):
+        """Test deposit and withdrawal outcomes against the starting balance."""
+        user_id, account_id = _seed_user_account(db_session, balance=balance)
+
+        operation = getattr(txn_service, op)
+        if error:
+            with pytest.raises(ValueError, match=error):
+                operation(account_id=account_id, amount=amount)
+            return
+
+        transaction = operation(account_id=account_id, amount=amount)
         db_session.commit()
 
-        acc_service = AccountService(db_session)
-        account = acc_service.create_account(
-            holder_id=UUID(hex=user["id"].hex),
-            account_type="Savings",
-            initial_balance=Decimal("50.00"),
-        )
-        db_session.commit()
-
-        # Test
-        txn_service = TransactionService(db_session)
-        with pytest.raises(ValueError, match="Insufficient funds"):
-            txn_service.withdrawal(
-                account_id=UUID(hex=account["id"].hex),
-                amount=Decimal("100.00"),
-            )
+        assert transaction["transaction_type"] == op
+        assert transaction["amount"] == amount
+        assert transaction["balance_after"] == balance_after
 
 
 class TestTransferService:
     """Tests for TransferService."""
 
-    def test_transfer_money(self, db_session):
+    def test_transfer_money(self, db_session, acc_service, transfer_service):
         """Test transferring money between accounts."""
         # Setup
-        user_service = UserService(db_session)
-        user1 = user_service.create_user(
-            email="user1@example.com",
-            password="TestPass123!",
-            first_name="User",
-            last_name="One",
-        )
-        user2 = user_service.create_user(
-            email="user2@example.com",
-            password="TestPass123!",
-            first_name="User",
-            last_name="Two",
-        )
-        db_session.commit()
+        user1_id = _seed_user(db_session, email="user1@example.com")
+        user2_id = _seed_user(db_session, email="user2@example.com")
 
-        acc_service = AccountService(db_session)
         account1 = acc_service.create_account(
-            holder_id=UUID(hex=user1["id"].hex),
+            holder_id=user1_id,
             account_type="Savings",
-            initial_balance=Decimal("1000.00"),
+            initial_balance=_D1000,
         )
         account2 = acc_service.create_account(
-            holder_id=UUID(hex=user2["id"].hex),
+            holder_id=user2_id,
             account_type="Savings",
-            initial_balance=Decimal("0.00"),
+            initial_balance=_D0,
         )
-        db_session.commit()
 
         # Test
-        transfer_service = TransferService(db_session)
         transfer = transfer_service.transfer_money(
-            from_account_id=UUID(hex=account1["id"].hex),
-            to_account_id=UUID(hex=account2["id"].hex),
-            amount=Decimal("500.00"),
+            from_account_id=account1["id"],
+            to_account_id=account2["id"],
+            amount=_D500,
         )
         db_session.commit()
 
-        assert transfer["amount"] == Decimal("500.00")
+        assert transfer["amount"] == _D500
         assert transfer["status"] == "completed"
 
-    def test_transfer_same_account(self, db_session):
+    def test_transfer_same_account(self, db_session, transfer_service):
         """Test transferring to same account raises error."""
         # Setup
-        user_service = UserService(db_session)
-        user = user_service.create_user(
-            email="test@example.com",
-            password="TestPass123!",
-            first_name="John",
-            last_name="Doe",
-        )
-        db_session.commit()
-
-        acc_service = AccountService(db_session)
-        account = acc_service.create_account(
-            holder_id=UUID(hex=user["id"].hex),
-            account_type="Savings",
-            initial_balance=Decimal("1000.00"),
-        )
-        db_session.commit()
+        user_id, account_id = _seed_user_account(db_session)
 
         # Test
-        transfer_service = TransferService(db_session)
-        with pytest.raises(ValueError, match="same account"):
+        with pytest.raises(ValueError, match=_RX_SAME):
             transfer_service.transfer_money(
-                from_account_id=UUID(hex=account["id"].hex),
-                to_account_id=UUID(hex=account["id"].hex),
-                amount=Decimal("500.00"),
+                from_account_id=account_id,
+                to_account_id=account_id,
+                amount=_D500,
             )
 
 
 class TestCardService:
     """Tests for CardService."""
 
-    def test_create_card(self, db_session):
+    def test_create_card(self, db_session, card_service):
         """Test creating a card."""
         # Setup
-        user_service = UserService(db_session)
-        user = user_service.create_user(
-            email="test@example.com",
-            password="TestPass123!",
-            first_name="John",
-            last_name="Doe",
-        )
-        db_session.commit()
-
-        acc_service = AccountService(db_session)
-        account = acc_service.create_account(
-            holder_id=UUID(hex=user["id"].hex),
-            account_type="Savings",
-            initial_balance=Decimal("1000.00"),
-        )
-        db_session.commit()
+        user_id, account_id = _seed_user_account(db_session)
 
         # Test
-        card_service = CardService(db_session)
         card = card_service.create_card(
-            holder_id=UUID(hex=user["id"].hex),
-            account_id=UUID(hex=account["id"].hex),
+            holder_id=user_id,
+            account_id=account_id,
             card_type="debit",
         )
         db_session.commit()
@@ -353,36 +316,19 @@ class TestCardService:
         assert card["card_type"] == "debit"
         assert card["status"] == "active"
 
-    def test_block_card(self, db_session):
+    def test_block_card(self, db_session, card_service):
         """Test blocking a card."""
         # Setup
-        user_service = UserService(db_session)
-        user = user_service.create_user(
-            email="test@example.com",
-            password="TestPass123!",
-            first_name="John",
-            last_name="Doe",
-        )
-        db_session.commit()
+        user_id, account_id = _seed_user_account(db_session)
 
-        acc_service = AccountService(db_session)
-        account = acc_service.create_account(
-            holder_id=UUID(hex=user["id"].hex),
-            account_type="Savings",
-            initial_balance=Decimal("1000.00"),
-        )
-        db_session.commit()
-
-        card_service = CardService(db_session)
         card = card_service.create_card(
-            holder_id=UUID(hex=user["id"].hex),
-            account_id=UUID(hex=account["id"].hex),
+            holder_id=user_id,
+            account_id=account_id,
             card_type="debit",
         )
-        db_session.commit()
 
         # Test
-        blocked_card = card_service.block_card(UUID(hex=card["id"].hex))
+        blocked_card = card_service.block_card(card["id"])
         db_session.commit()
 
         assert blocked_card["status"] == "blocked"